@@ -1,19 +1,29 @@
+import csv
+import json
+import os
+import time
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Discount rates for student category
+STUDENT_DISCOUNTS = {
+    'high': 0.9,   # 10% discount for price > 1000
+    'low': 0.95    # 5% discount for price <= 1000
+}
+
+# Discount rates for regular category
+REGULAR_DISCOUNTS = {
+    'high': 0.85,  # 15% discount for price > 2000
+    'low': 1.0     # No discount for price <= 2000
+}
+
+
 def discount(price: float, category: str) -> float:
    
-    # Define discount rates for student category
-    student_discounts = {
-        'high': 0.9,   # 10% discount for price > 1000
-        'low': 0.95    # 5% discount for price <= 1000
-    }
-    
-    # Define discount rates for regular category
-    regular_discounts = {
-        'high': 0.85,  # 15% discount for price > 2000
-        'low': 1.0     # No discount for price <= 2000
-    }
-    
     # Determine which discount structure to use
-    discounts = student_discounts if category == "student" else regular_discounts
+    discounts = STUDENT_DISCOUNTS if category == "student" else REGULAR_DISCOUNTS
     
     # Get the threshold price for determining discount level
     threshold = 1000 if category == "student" else 2000
@@ -25,6 +35,116 @@ def discount(price: float, category: str) -> float:
     return price * discount_rate
 
 
+class PricingRuleSet:
+    """
+    A compiled table of tiered discount rates per customer category.
+    
+    Each category maps to a list of ``(threshold, rate)`` tiers. A tier's
+    rate applies to prices strictly above its threshold; the lowest tier
+    also covers every price up to the next threshold. The spec is compiled
+    once into sorted threshold arrays so that each lookup is a dict access
+    plus a binary search.
+    
+    Attributes
+    ----------
+    default_category : str
+        The category used for unknown categories.
+    
+    Methods
+    -------
+    rate(price, category):
+        Return the discount rate for a price in a category.
+    apply(price, category):
+        Return the discounted price.
+    
+    Examples
+    --------
+    >>> rules = PricingRuleSet({"student": [(0, 0.95), (1000, 0.9)],
+    ...                         "regular": [(0, 1.0), (2000, 0.85)]})
+    >>> rules.apply(1500, "student")
+    1350.0
+    """
+    
+    def __init__(self, spec: dict, default_category: str = "regular"):
+        """
+        Compile a pricing rule spec.
+        
+        Parameters
+        ----------
+        spec : dict
+            Mapping of category to a list of ``(threshold, rate)`` tiers.
+        default_category : str
+            The category whose tiers are used for unknown categories.
+        
+        Raises
+        ------
+        ValueError
+            If a category has no tiers, repeats a threshold, or the
+            default category is missing from the spec.
+        """
+        self._tables = {}
+        for category, tiers in spec.items():
+            tiers = sorted(tiers)
+            thresholds = [threshold for threshold, _ in tiers]
+            if not thresholds:
+                raise ValueError(f"Category '{category}' has no pricing tiers")
+            if len(set(thresholds)) != len(thresholds):
+                raise ValueError(f"Category '{category}' repeats a threshold")
+            # Store thresholds and rates as parallel tuples for bisect
+            self._tables[category] = (tuple(thresholds), tuple(rate for _, rate in tiers))
+        
+        if default_category not in self._tables:
+            raise ValueError(f"Default category '{default_category}' not in spec")
+        self.default_category = default_category
+        self._default_table = self._tables[default_category]
+    
+    def rate(self, price: float, category: str) -> float:
+        """
+        Return the discount rate for a price in a category.
+        
+        Parameters
+        ----------
+        price : float
+            The original price of the item.
+        category : str
+            The customer category.
+        
+        Returns
+        -------
+        float
+            The multiplier to apply to the price.
+        """
+        thresholds, rates = self._tables.get(category, self._default_table)
+        # Number of thresholds strictly below the price selects the tier
+        index = bisect_left(thresholds, price)
+        return rates[index - 1] if index else rates[0]
+    
+    def apply(self, price: float, category: str) -> float:
+        """
+        Return the discounted price for a price in a category.
+        
+        Parameters
+        ----------
+        price : float
+            The original price of the item.
+        category : str
+            The customer category.
+        
+        Returns
+        -------
+        float
+            The discounted price.
+        """
+        return price * self.rate(price, category)
+
+
+# Default rule set matching the student/regular thresholds
+DEFAULT_PRICING_RULES = PricingRuleSet({
+    "student": [(0, STUDENT_DISCOUNTS['low']), (1000, STUDENT_DISCOUNTS['high'])],
+    "regular": [(0, REGULAR_DISCOUNTS['low']), (2000, REGULAR_DISCOUNTS['high'])],
+})
+
+
 # Alternative implementation using dictionary mapping
 def discount_v2(price: float, category: str) -> float:
     """
@@ -42,17 +162,8 @@ def discount_v2(price: float, category: str) -> float:
     float
         The discounted price.
     """
-    # Define pricing rules as a nested dictionary
-    pricing_rules = {
-        "student": [(1000, 0.9), (float('inf'), 0.95)],
-        "regular": [(2000, 0.85), (float('inf'), 1.0)]
-    }
-    
-    # Get rules for the given category
-    rules = pricing_rules.get(category, pricing_rules["regular"])
-    
-    # Find applicable discount rate
-    discount_rate = next(rate for threshold, rate in rules if price > threshold)
+    # Look up the rate in the precompiled pricing rules
+    discount_rate = DEFAULT_PRICING_RULES.rate(price, category)
     
     # Return discounted price
     return price * discount_rate
@@ -145,6 +256,414 @@ def discount_v5(price: float, category: str) -> float:
             return price
 
 
+# Batch implementation using vectorized masks
+def discount_batch(prices, categories):
+    """
+    Calculate discounted prices for whole columns of prices and categories.
+
+    Uses NumPy boolean masks so that a batch of cart lines is priced in a
+    single pass. Falls back to calling `discount` per line if NumPy is
+    not installed.
+
+    Parameters
+    ----------
+    prices : array-like of float
+        The original prices of the items.
+    categories : array-like of str
+        The customer category of each item ('student' or other).
+
+    Returns
+    -------
+    numpy.ndarray or list
+        The discounted prices, as a float64 array when NumPy is available
+        and as a list of floats otherwise.
+
+    Examples
+    --------
+    >>> [float(x) for x in discount_batch([500, 1500, 2500], ["student", "student", "regular"])]
+    [475.0, 1350.0, 2125.0]
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        # Fallback to the scalar implementation if numpy not available
+        if len(prices) != len(categories):
+            raise ValueError("prices and categories must have the same length")
+        return [discount(price, category) for price, category in zip(prices, categories)]
+
+    prices = np.asarray(prices, dtype=np.float64)
+    categories = np.asarray(categories)
+    if prices.shape != categories.shape:
+        raise ValueError("prices and categories must have the same length")
+
+    # Apply all discount rates at once
+    return prices * _batch_rates(np, prices, categories == "student")
+
+
+def _batch_rates(np, prices, is_student):
+    """Return the discount rate for each price from boolean bucket masks."""
+    return np.select(
+        [is_student & (prices > 1000), is_student, prices > 2000],
+        [0.9, 0.95, 0.85],
+        default=1.0,
+    )
+
+
+# Multi-process implementation using shared memory shards
+def _price_shard(names: tuple, size: int, start: int, stop: int) -> int:
+    """Price rows [start, stop) of the shared price/mask/output blocks."""
+    import numpy as np
+    from multiprocessing.shared_memory import SharedMemory
+    
+    blocks = [SharedMemory(name=name) for name in names]
+    try:
+        prices = np.ndarray((size,), np.float64, buffer=blocks[0].buf)[start:stop]
+        is_student = np.ndarray((size,), np.bool_, buffer=blocks[1].buf)[start:stop]
+        out = np.ndarray((size,), np.float64, buffer=blocks[2].buf)[start:stop]
+        out[:] = prices * _batch_rates(np, prices, is_student)
+        # Views must be released before the blocks can be closed
+        del prices, is_student, out
+    finally:
+        for block in blocks:
+            block.close()
+    return stop - start
+
+
+def discount_parallel(prices, categories, workers: int = None,
+                      chunk_size: int = 1_000_000):
+    """
+    Calculate discounted prices by sharding the batch across processes.
+    
+    The price column, the student mask and the output are placed in
+    `multiprocessing.shared_memory` blocks, so workers only receive block
+    names and shard bounds instead of pickled arrays. Shards write into
+    their own slice of the output, which keeps the result in input order.
+    Without NumPy, shards are pickled and priced with `discount_batch`.
+    
+    Parameters
+    ----------
+    prices : array-like of float
+        The original prices of the items.
+    categories : array-like of str
+        The customer category of each item ('student' or other).
+    workers : int, optional
+        Number of worker processes. Defaults to the CPU count.
+    chunk_size : int
+        Number of rows per shard.
+    
+    Returns
+    -------
+    numpy.ndarray or list
+        The discounted prices, in input order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    
+    try:
+        import numpy as np
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError:
+        # Fallback to pickled shards if numpy not available
+        if len(prices) != len(categories):
+            raise ValueError("prices and categories must have the same length")
+        bounds = range(0, len(prices), chunk_size)
+        with ProcessPoolExecutor(workers) as executor:
+            shards = executor.map(discount_batch,
+                                  [prices[i:i + chunk_size] for i in bounds],
+                                  [categories[i:i + chunk_size] for i in bounds])
+            return [price for shard in shards for price in shard]
+    
+    prices = np.asarray(prices, dtype=np.float64)
+    is_student = np.asarray(categories) == "student"
+    if prices.shape != is_student.shape:
+        raise ValueError("prices and categories must have the same length")
+    size = len(prices)
+    if size == 0:
+        return np.empty(0, dtype=np.float64)
+    
+    # Allocate shared blocks for prices, student mask and output
+    blocks = [SharedMemory(create=True, size=prices.nbytes),
+              SharedMemory(create=True, size=is_student.nbytes),
+              SharedMemory(create=True, size=prices.nbytes)]
+    try:
+        np.ndarray((size,), np.float64, buffer=blocks[0].buf)[:] = prices
+        np.ndarray((size,), np.bool_, buffer=blocks[1].buf)[:] = is_student
+        names = tuple(block.name for block in blocks)
+        
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_price_shard, names, size, start,
+                                       min(start + chunk_size, size))
+                       for start in range(0, size, chunk_size)]
+            for future in futures:
+                future.result()
+        
+        return np.ndarray((size,), np.float64, buffer=blocks[2].buf).copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+class DiscountCache:
+    """
+    A bounded LRU cache around one of the discount implementations.
+    
+    Attributes
+    ----------
+    func : callable
+        The wrapped ``func(price, category)`` implementation.
+    maxsize : int
+        The maximum number of cached (price, category) pairs.
+    hits : int
+        Number of calls answered from the cache.
+    misses : int
+        Number of calls that ran the wrapped implementation.
+    evictions : int
+        Number of entries dropped to stay within maxsize.
+    
+    Methods
+    -------
+    stats():
+        Return the counters and hit rate as a dict.
+    clear():
+        Drop all entries and reset the counters.
+    
+    Examples
+    --------
+    >>> cached = DiscountCache(discount, maxsize=2)
+    >>> cached(1500, "student"), cached(1500, "student")
+    (1350.0, 1350.0)
+    >>> cached.hits, cached.misses
+    (1, 1)
+    """
+    
+    def __init__(self, func=discount, maxsize: int = 4096):
+        """
+        Initialize a DiscountCache object.
+        
+        Parameters
+        ----------
+        func : callable
+            The discount implementation to memoize.
+        maxsize : int
+            The maximum number of cached entries.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.func = func
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __call__(self, price: float, category: str) -> float:
+        """Return the discounted price, computing it only on a cache miss."""
+        key = (price, category)
+        entries = self._entries
+        try:
+            result = entries[key]
+        except KeyError:
+            self.misses += 1
+            result = entries[key] = self.func(price, category)
+            # Evict the least recently used entry once over capacity
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+            entries.move_to_end(key)
+        return result
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def stats(self) -> dict:
+        """
+        Return the cache counters.
+        
+        Returns
+        -------
+        dict
+            'hits', 'misses', 'evictions', 'size', 'maxsize' and 'hit_rate'.
+        """
+        calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / calls if calls else 0.0,
+        }
+    
+    def clear(self) -> None:
+        """Drop all cached entries and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+# Streaming pipeline over CSV/JSONL order files
+def _detect_format(path: str, fmt: str = None) -> str:
+    """Return 'csv' or 'jsonl' from an explicit format or the file suffix."""
+    if fmt is None:
+        fmt = os.path.splitext(path)[1].lstrip(".").lower()
+        fmt = "jsonl" if fmt in ("json", "ndjson") else fmt
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported pricing file format: '{fmt}'")
+    return fmt
+
+
+def iter_price_chunks(path: str, chunk_size: int = 10000, fmt: str = None):
+    """
+    Read order rows from a CSV or JSONL file in fixed-size chunks.
+    
+    Parameters
+    ----------
+    path : str
+        The input file; rows need 'price' and 'category' fields.
+    chunk_size : int
+        The maximum number of rows per chunk.
+    fmt : str, optional
+        'csv' or 'jsonl'. Detected from the file suffix if omitted.
+    
+    Yields
+    ------
+    list of dict
+        The next chunk of rows, with 'price' converted to float.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    fmt = _detect_format(path, fmt)
+    
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        
+        chunk = []
+        for row in rows:
+            row["price"] = float(row["price"])
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _price_columns(prices: list, categories: list) -> list:
+    """Price one chunk of columns and return plain floats."""
+    prices = discount_batch(prices, categories)
+    # Convert NumPy scalars back to plain floats for serialization
+    return prices.tolist() if hasattr(prices, "tolist") else prices
+
+
+def price_chunks(chunks):
+    """
+    Add a 'discounted_price' field to every row of every chunk.
+    
+    Parameters
+    ----------
+    chunks : iterable of list of dict
+        Chunks of rows as produced by `iter_price_chunks`.
+    
+    Yields
+    ------
+    list of dict
+        The same chunks, priced with `discount_batch`.
+    """
+    for chunk in chunks:
+        prices = _price_columns([row["price"] for row in chunk],
+                                [row["category"] for row in chunk])
+        for row, discounted in zip(chunk, prices):
+            row["discounted_price"] = discounted
+        yield chunk
+
+
+def _price_chunks_parallel(chunks, workers: int = None):
+    """Like `price_chunks`, but prices chunks in a process pool, in order."""
+    # Bound the number of chunks in flight to keep memory constant
+    window = 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            future = executor.submit(_price_columns,
+                                     [row["price"] for row in chunk],
+                                     [row["category"] for row in chunk])
+            pending.append((chunk, future))
+            if len(pending) >= window:
+                yield _attach_prices(*pending.popleft())
+        while pending:
+            yield _attach_prices(*pending.popleft())
+
+
+def _attach_prices(chunk: list, future) -> list:
+    """Store the priced column of a finished shard back on its rows."""
+    for row, discounted in zip(chunk, future.result()):
+        row["discounted_price"] = discounted
+    return chunk
+
+
+def run_pricing_pipeline(input_path: str, output_path: str,
+                         chunk_size: int = 10000, fmt: str = None,
+                         workers: int = 1) -> dict:
+    """
+    Price an order file chunk by chunk and write the priced rows out.
+    
+    Only a bounded number of chunks is held in memory at a time, so memory
+    use does not grow with the size of the input. The output uses the
+    input's format and keeps the input's row order.
+    
+    Parameters
+    ----------
+    input_path : str
+        The CSV or JSONL file to read.
+    output_path : str
+        The file to write priced rows to.
+    chunk_size : int
+        The number of rows priced per batch.
+    fmt : str, optional
+        'csv' or 'jsonl'. Detected from the input suffix if omitted.
+    workers : int, optional
+        Number of worker processes; 1 prices in this process and None
+        uses the CPU count.
+    
+    Returns
+    -------
+    dict
+        'rows', 'seconds' and 'rows_per_sec' for the run.
+    """
+    fmt = _detect_format(input_path, fmt)
+    start = time.perf_counter()
+    rows = 0
+    
+    with open(output_path, "w", newline="", encoding="utf-8") as out:
+        writer = None
+        chunks = iter_price_chunks(input_path, chunk_size, fmt)
+        if workers == 1:
+            chunks = price_chunks(chunks)
+        else:
+            chunks = _price_chunks_parallel(chunks, workers)
+        for chunk in chunks:
+            if fmt == "csv":
+                if writer is None:
+                    writer = csv.DictWriter(out, fieldnames=list(chunk[0]))
+                    writer.writeheader()
+                writer.writerows(chunk)
+            else:
+                out.writelines(json.dumps(row) + "\n" for row in chunk)
+            rows += len(chunk)
+    
+    seconds = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds > 0 else float("inf"),
+    }
+
+
 # Test cases
 def run_tests():
     """Run comprehensive test cases for all implementations."""
@@ -194,5 +713,287 @@ def run_tests():
     print("\n" + "="*70)
 
 
+def run_batch_tests():
+    """Check that the batch implementation matches the scalar ones."""
+    import random
+    
+    print("Testing Batch Discount Implementation")
+    print("="*70)
+    
+    # Mix of boundary prices and random prices across both categories
+    rng = random.Random(0)
+    prices = [500, 1500, 1500, 2500, 1000, 2000, 1000.01, 2000.01]
+    prices += [round(rng.uniform(0, 4000), 2) for _ in range(1000)]
+    categories = ["student", "student", "regular", "regular",
+                  "student", "regular", "student", "guest"]
+    categories += [rng.choice(["student", "regular"]) for _ in range(1000)]
+    
+    batch = list(discount_batch(prices, categories))
+    
+    for impl_name, impl_func in [
+        ("Original", discount),
+        ("Dictionary-based", discount_v2),
+        ("Lambda-based", discount_v3),
+        ("Ternary-based", discount_v4),
+        ("Match-case-based", discount_v5),
+    ]:
+        expected = [impl_func(p, c) for p, c in zip(prices, categories)]
+        status = "✓ MATCH" if batch == expected else "✗ MISMATCH"
+        print(f"{status} | Batch vs {impl_name:20} | Rows: {len(prices)}")
+    
+    print("="*70)
+
+
+def run_pipeline_tests():
+    """Run the streaming pipeline over small CSV and JSONL files."""
+    import tempfile
+    
+    print("Testing Streaming Pricing Pipeline")
+    print("="*70)
+    
+    orders = [(500, "student"), (1500, "student"), (1500, "regular"),
+              (2500, "regular"), (1000, "student"), (2000, "regular")]
+    expected = [discount(price, category) for price, category in orders]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_in = os.path.join(tmp, "orders.csv")
+        with open(csv_in, "w", newline="") as f:
+            f.write("order_id,price,category\n")
+            f.writelines(f"{i},{p},{c}\n" for i, (p, c) in enumerate(orders))
+        
+        jsonl_in = os.path.join(tmp, "orders.jsonl")
+        with open(jsonl_in, "w") as f:
+            f.writelines(json.dumps({"order_id": i, "price": p, "category": c}) + "\n"
+                         for i, (p, c) in enumerate(orders))
+        
+        for name, src, dst, workers in [
+            ("CSV", csv_in, os.path.join(tmp, "out.csv"), 1),
+            ("JSONL", jsonl_in, os.path.join(tmp, "out.jsonl"), 1),
+            ("CSV", csv_in, os.path.join(tmp, "out_parallel.csv"), 2),
+        ]:
+            stats = run_pricing_pipeline(src, dst, chunk_size=4, workers=workers)
+            with open(dst, newline="") as f:
+                if name == "CSV":
+                    result = [float(row["discounted_price"]) for row in csv.DictReader(f)]
+                else:
+                    result = [json.loads(line)["discounted_price"] for line in f]
+            status = "✓ MATCH" if result == expected else "✗ MISMATCH"
+            print(f"{status} | {name:5} | Workers: {workers} | Rows: {stats['rows']} | "
+                  f"Rows/sec: {stats['rows_per_sec']:,.0f}")
+    
+    print("="*70)
+
+
+def run_parallel_tests():
+    """Check the sharded multi-process runner against the batch results."""
+    import random
+    
+    print("Testing Multi-Process Sharded Pricing")
+    print("="*70)
+    
+    rng = random.Random(1)
+    prices = [round(rng.uniform(0, 4000), 2) for _ in range(10000)]
+    categories = [rng.choice(["student", "regular"]) for _ in range(10000)]
+    expected = list(discount_batch(prices, categories))
+    
+    for workers, chunk_size in [(1, 10000), (2, 1000), (4, 333)]:
+        start = time.perf_counter()
+        result = list(discount_parallel(prices, categories, workers, chunk_size))
+        elapsed = time.perf_counter() - start
+        status = "✓ MATCH" if result == expected else "✗ MISMATCH"
+        print(f"{status} | Workers: {workers} | Chunk size: {chunk_size:5} | "
+              f"Time: {elapsed:.4f}s")
+    
+    print("="*70)
+
+
+def run_cache_tests():
+    """Compare cached and uncached pricing on a skewed input mix."""
+    import random
+    
+    print("Testing Memoizing Discount Cache")
+    print("="*70)
+    
+    # Skewed mix: a few popular (price, category) pairs dominate
+    rng = random.Random(2)
+    popular = [(rng.choice([499, 999, 1499, 2499]), rng.choice(["student", "regular"]))
+               for _ in range(50)]
+    orders = [rng.choice(popular) if rng.random() < 0.9
+              else (round(rng.uniform(0, 4000), 2), "regular")
+              for _ in range(100000)]
+    
+    for impl_name, impl_func in [("Original", discount), ("Match-case-based", discount_v5)]:
+        cached = DiscountCache(impl_func, maxsize=256)
+        
+        start = time.perf_counter()
+        expected = [impl_func(p, c) for p, c in orders]
+        plain_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        result = [cached(p, c) for p, c in orders]
+        cached_time = time.perf_counter() - start
+        
+        stats = cached.stats()
+        status = "✓ MATCH" if result == expected else "✗ MISMATCH"
+        print(f"{status} | {impl_name:16} | Hit rate: {stats['hit_rate']:.1%} | "
+              f"Evictions: {stats['evictions']:5} | "
+              f"Plain: {plain_time:.4f}s | Cached: {cached_time:.4f}s")
+    
+    print("="*70)
+
+
+def _benchmark_inputs(size: int, seed: int = 0) -> dict:
+    """Build the named (prices, categories) input mixes for benchmarking."""
+    import random
+    
+    rng = random.Random(seed)
+    boundaries = [999.99, 1000, 1000.01, 1999.99, 2000, 2000.01]
+    
+    def prices():
+        return [round(rng.uniform(0, 4000), 2) for _ in range(size)]
+    
+    return {
+        "all-student": (prices(), ["student"] * size),
+        "all-regular": (prices(), ["regular"] * size),
+        "mixed": (prices(), [rng.choice(["student", "regular"]) for _ in range(size)]),
+        "boundary-heavy": ([rng.choice(boundaries) for _ in range(size)],
+                           [rng.choice(["student", "regular"]) for _ in range(size)]),
+    }
+
+
+def benchmark_discounts(size: int = 10000, repeats: int = 15, warmup: int = 3,
+                        output_path: str = None) -> dict:
+    """
+    Time every discount implementation on several input mixes.
+    
+    Each measurement prices the whole input once with
+    `time.perf_counter_ns`; warmup runs are discarded and the remaining
+    repeats are summarized as per-call median and p95 nanoseconds.
+    
+    Parameters
+    ----------
+    size : int
+        Number of (price, category) pairs per input mix.
+    repeats : int
+        Number of timed runs per implementation and mix.
+    warmup : int
+        Number of untimed runs before measuring.
+    output_path : str, optional
+        If given, the results are also written there as JSON.
+    
+    Returns
+    -------
+    dict
+        Benchmark settings and one result entry per implementation and mix.
+    """
+    import platform
+    import statistics
+    
+    if repeats < 2:
+        raise ValueError("repeats must be at least 2")
+    
+    implementations = [
+        ("discount", discount),
+        ("discount_v2", discount_v2),
+        ("discount_v3", discount_v3),
+        ("discount_v4", discount_v4),
+        ("discount_v5", discount_v5),
+    ]
+    
+    results = []
+    for mix_name, (prices, categories) in _benchmark_inputs(size).items():
+        pairs = list(zip(prices, categories))
+        for impl_name, impl_func in implementations:
+            for _ in range(warmup):
+                for price, category in pairs:
+                    impl_func(price, category)
+            
+            samples = []
+            for _ in range(repeats):
+                start = time.perf_counter_ns()
+                for price, category in pairs:
+                    impl_func(price, category)
+                samples.append((time.perf_counter_ns() - start) / size)
+            
+            results.append({
+                "implementation": impl_name,
+                "mix": mix_name,
+                "median_ns": statistics.median(samples),
+                "p95_ns": statistics.quantiles(samples, n=20, method="inclusive")[-1],
+                "min_ns": min(samples),
+            })
+    
+    report = {
+        "python": platform.python_version(),
+        "size": size,
+        "repeats": repeats,
+        "warmup": warmup,
+        "results": results,
+    }
+    if output_path is not None:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+def find_regressions(baseline: dict, current: dict, tolerance: float = 0.1) -> list:
+    """
+    Compare two `benchmark_discounts` reports and list slowdowns.
+    
+    Parameters
+    ----------
+    baseline : dict
+        The reference report, e.g. loaded from a saved JSON file.
+    current : dict
+        The report to check.
+    tolerance : float
+        Allowed relative increase of the median before it counts.
+    
+    Returns
+    -------
+    list of dict
+        One entry per implementation and mix whose median slowed down by
+        more than the tolerance, with both medians and the ratio.
+    """
+    reference = {(entry["implementation"], entry["mix"]): entry["median_ns"]
+                 for entry in baseline["results"]}
+    regressions = []
+    for entry in current["results"]:
+        key = (entry["implementation"], entry["mix"])
+        if key in reference and entry["median_ns"] > reference[key] * (1 + tolerance):
+            regressions.append({
+                "implementation": key[0],
+                "mix": key[1],
+                "baseline_ns": reference[key],
+                "current_ns": entry["median_ns"],
+                "ratio": entry["median_ns"] / reference[key],
+            })
+    return regressions
+
+
+def run_benchmarks(output_path: str = None):
+    """Print a benchmark table for all discount implementations."""
+    print("Benchmarking Discount Implementations (ns per call)")
+    print("="*70)
+    
+    report = benchmark_discounts(output_path=output_path)
+    
+    current_mix = None
+    for entry in report["results"]:
+        if entry["mix"] != current_mix:
+            current_mix = entry["mix"]
+            print(f"\nInput mix: {current_mix}")
+            print("-" * 70)
+        print(f"{entry['implementation']:12} | Median: {entry['median_ns']:8.1f} | "
+              f"p95: {entry['p95_ns']:8.1f}")
+    
+    print("\n" + "="*70)
+
+
 if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
+    run_tests()
+    run_batch_tests()
+    run_pipeline_tests()
+    run_parallel_tests()
+    run_cache_tests()
+    run_benchmarks()
\ No newline at end of file
@@ -1,3 +1,18 @@
+import csv
+import json
+import math
+import numbers
+import os
+import pickle
+import sys
+import tempfile
+import zlib
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from heapq import merge
+
+
 def find_common(a: list, b: list) -> list:
     """
     Find common elements between two lists using nested loop approach.
@@ -277,11 +292,44 @@ def find_common_v9(a: list, b: list) -> list:
         return list(set(a) & set(b))
 
 
-def find_common_v10(a: list, b: list) -> list:
+# Size ratio above which find_common_v10 gallops instead of walking both lists
+GALLOP_RATIO = 32
+
+
+def _gallop_common(small: list, large: list) -> list:
+    """Intersect two sorted lists by exponential search into the larger one."""
+    result = []
+    size = len(large)
+    lo = 0
+    
+    for x in small:
+        if result and result[-1] == x:
+            continue
+        # Double the step until large[hi] >= x, then binary search the gap
+        hi, step = lo, 1
+        while hi < size and large[hi] < x:
+            lo = hi + 1
+            hi += step
+            step *= 2
+        lo = bisect_left(large, x, lo, min(hi, size))
+        if lo == size:
+            break
+        if large[lo] == x:
+            result.append(x)
+    
+    return result
+
+
+def find_common_v10(a: list, b: list, assume_sorted: bool = False) -> list:
     """
     Find common elements using sorted two-pointer approach (OPTIMIZED).
     
-    Time Complexity: O(n log n + m log m)
+    When one list is more than GALLOP_RATIO times longer than the other,
+    the shorter list is walked and each element is located in the longer
+    one with exponential (galloping) search instead.
+    
+    Time Complexity: O(n log n + m log m), or O(n + m) for sorted input
+    and O(n log m) for sorted input with n much smaller than m
     Space Complexity: O(1) excluding output
     
     Parameters
@@ -290,6 +338,8 @@ def find_common_v10(a: list, b: list) -> list:
         The first list.
     b : list
         The second list.
+    assume_sorted : bool
+        Skip sorting because both lists are already in ascending order.
     
     Returns
     -------
@@ -300,10 +350,21 @@ def find_common_v10(a: list, b: list) -> list:
     --------
     >>> find_common_v10([1, 2, 3, 4], [3, 4, 5, 6])
     [3, 4]
+    >>> find_common_v10([3, 9], list(range(0, 1000, 3)), assume_sorted=True)
+    [3, 9]
     """
     # Sort both lists
-    sorted_a = sorted(a)
-    sorted_b = sorted(b)
+    if assume_sorted:
+        sorted_a, sorted_b = a, b
+    else:
+        sorted_a = sorted(a)
+        sorted_b = sorted(b)
+    
+    # Gallop through the longer list when the sizes are very different
+    if len(sorted_a) * GALLOP_RATIO < len(sorted_b):
+        return _gallop_common(sorted_a, sorted_b)
+    if len(sorted_b) * GALLOP_RATIO < len(sorted_a):
+        return _gallop_common(sorted_b, sorted_a)
     
     # Initialize pointers and result
     i, j = 0, 0
@@ -326,106 +387,2509 @@ def find_common_v10(a: list, b: list) -> list:
     return result
 
 
-# Comprehensive Testing
-def run_comparison_tests():
-    """Run comprehensive tests comparing all implementations."""
+def find_common_v11(a, b, assume_unique: bool = False, dtype=None):
+    """
+    Find common elements of NumPy arrays without leaving NumPy (OPTIMIZED).
     
-    test_cases = [
-        ([1, 2, 3, 4], [3, 4, 5, 6], "Basic case"),
-        ([1, 1, 2, 2, 3, 3], [2, 2, 3, 3, 4], "Duplicates"),
-        ([], [1, 2, 3], "Empty first list"),
-        ([1, 2, 3], [], "Empty second list"),
-        ([], [], "Both empty"),
-        ([1, 2, 3], [1, 2, 3], "Identical lists"),
-        ([1, 2, 3], [4, 5, 6], "No common elements"),
-        (['a', 'b', 'c'], ['b', 'c', 'd'], "String elements"),
-        ([1, 2, 3, 4, 5], [5, 4, 3, 2, 1], "Reversed order"),
-        (list(range(1000)), list(range(500, 1500)), "Large lists"),
-    ]
+    Unlike find_common_v9, inputs are used as arrays in place (including
+    ``np.memmap`` files and buffer-protocol objects such as memoryview or
+    array.array) and the result stays an ndarray, so no Python object is
+    created per element.
     
-    implementations = [
-        ("Original (Nested Loop)", find_common),
-        ("v2: Set Intersection", find_common_v2),
-        ("v3: List Comprehension", find_common_v3),
-        ("v4: Filter + Lambda", find_common_v4),
-        ("v5: Set with Order", find_common_v5),
-        ("v6: Dict.fromkeys", find_common_v6),
-        ("v7: Set Operations", find_common_v7),
-        ("v8: Any() Generator", find_common_v8),
-        ("v9: NumPy (if available)", find_common_v9),
-        ("v10: Two-Pointer", find_common_v10),
-    ]
+    Time Complexity: O(n log n + m log m)
+    Space Complexity: O(n + m) for the sorted copies
     
-    print("="*100)
-    print("COMPREHENSIVE OPTIMIZATION TEST - Find Common Elements")
-    print("="*100)
+    Parameters
+    ----------
+    a : numpy.ndarray or buffer
+        The first array.
+    b : numpy.ndarray or buffer
+        The second array.
+    assume_unique : bool
+        Both inputs have no repeated values, so deduplication is skipped.
+    dtype : numpy.dtype, optional
+        Element type for raw buffers without a format (such as bytes).
     
-    for test_num, (list_a, list_b, description) in enumerate(test_cases, 1):
-        print(f"\nTest Case {test_num}: {description}")
-        print(f"List A: {list_a if len(str(list_a)) < 50 else str(list_a)[:50] + '...'}")
-        print(f"List B: {list_b if len(str(list_b)) < 50 else str(list_b)[:50] + '...'}")
-        print("-" * 100)
+    Returns
+    -------
+    numpy.ndarray
+        The distinct common elements in ascending order.
+    
+    Examples
+    --------
+    >>> import numpy as np
+    >>> find_common_v11(np.array([1, 2, 3, 4]), np.array([3, 4, 5, 6])).tolist()
+    [3, 4]
+    """
+    import numpy as np
+    
+    def as_array(values):
+        if isinstance(values, np.ndarray):
+            return values
+        if dtype is not None:
+            return np.frombuffer(values, dtype=dtype)
+        # memoryview carries the buffer's element format, no copy is made
+        return np.asarray(memoryview(values))
+    
+    a_arr = as_array(a)
+    b_arr = as_array(b)
+    
+    # Sort (and deduplicate) each side once
+    if assume_unique:
+        sorted_a, sorted_b = np.sort(a_arr), np.sort(b_arr)
+    else:
+        sorted_a, sorted_b = _sorted_unique(np, a_arr), _sorted_unique(np, b_arr)
+    
+    # Binary search the smaller side into the larger one
+    if len(sorted_a) > len(sorted_b):
+        sorted_a, sorted_b = sorted_b, sorted_a
+    return sorted_a[_sorted_contains(np, sorted_b, sorted_a)]
+
+
+class IntBitmap:
+    """
+    A compact set of integers stored as roaring-style chunks.
+    
+    Values are split into a high key (``value >> 16``) and a 16-bit low
+    part. Each high key owns one container for its low parts: a sorted
+    ``array('H')`` while it holds at most ARRAY_MAX values, or an 8 KB
+    bitmap once it is denser than that. Sparse IDs therefore cost about
+    two bytes each and dense IDs about one bit each, instead of the ~60
+    bytes per element of a ``set``. Bitmap chunks are intersected with a
+    word-level ``&`` and counted with ``int.bit_count``.
+    
+    Methods
+    -------
+    tolist():
+        Return the values in ascending order.
+    intersection_count(other):
+        Count the common values without materializing them.
+    
+    Examples
+    --------
+    >>> common = IntBitmap([1, 2, 3, 70000]) & IntBitmap([3, 4, 70000])
+    >>> common.tolist(), len(common)
+    ([3, 70000], 2)
+    """
+    
+    __slots__ = ("_chunks",)
+    
+    CHUNK_BITS = 16
+    CHUNK_SIZE = 1 << CHUNK_BITS
+    # Above this many values a bitmap container is smaller than an array
+    ARRAY_MAX = 4096
+    
+    def __init__(self, values=()):
+        """
+        Build a bitmap from an iterable of integers.
         
-        results = {}
-        for impl_name, impl_func in implementations:
-            try:
-                result = impl_func(list_a, list_b)
-                results[impl_name] = result
-                status = "✓"
-                print(f"{status} {impl_name:30} : {result if len(str(result)) < 60 else str(result)[:60] + '...'}")
-            except Exception as e:
-                results[impl_name] = f"ERROR: {str(e)[:50]}"
-                print(f"✗ {impl_name:30} : ERROR - {str(e)[:50]}")
+        Parameters
+        ----------
+        values : iterable of int or numpy.ndarray
+            The integers to store. Duplicates are ignored.
         
-        # Verify all results match original
-        original_result = results.get("Original (Nested Loop)")
-        all_match = all(
-            result == original_result 
-            for name, result in results.items() 
-            if not isinstance(result, str) or not result.startswith("ERROR")
-        )
+        Raises
+        ------
+        TypeError
+            If a value is not an integer.
+        OverflowError
+            If an unsigned array holds values that do not fit in int64.
+        """
+        self._chunks = {}
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
         
-        print(f"Consistency: {'✓ All match' if all_match else '✗ Mismatch detected'}")
+        if np is not None and (hasattr(values, "dtype") or isinstance(values, list)):
+            self._build_numpy(np, np.asarray(values))
+        else:
+            self._build_python(values)
+    
+    def _build_numpy(self, np, values) -> None:
+        """Fill the chunks from an integer array with vectorized packing."""
+        if values.size == 0:
+            return
+        if values.dtype.kind not in "iu":
+            raise TypeError("IntBitmap only stores integers")
+        if values.dtype.kind == "u" and values.dtype.itemsize == 8 and values.max() > 2**63 - 1:
+            raise OverflowError("IntBitmap only stores integers that fit in int64")
+        values = np.sort(values.astype(np.int64, copy=False))
+        values = values[_run_starts(np, values)]
+        highs = values >> self.CHUNK_BITS
+        lows = (values & (self.CHUNK_SIZE - 1)).astype(np.uint16)
+        # Boundaries of each run of values sharing a high key
+        starts = np.flatnonzero(_run_starts(np, highs))
+        ends = np.append(starts[1:], len(values))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            if end - start <= self.ARRAY_MAX:
+                container = array("H", lows[start:end].tobytes())
+            else:
+                bits = np.zeros(self.CHUNK_SIZE, dtype=bool)
+                bits[lows[start:end]] = True
+                container = np.packbits(bits, bitorder="little").tobytes()
+            self._chunks[int(highs[start])] = container
+    
+    def _build_python(self, values) -> None:
+        """Fill the chunks one value at a time, grouping lows by high key."""
+        groups = {}
+        for value in values:
+            if not isinstance(value, int):
+                raise TypeError("IntBitmap only stores integers")
+            lows = groups.get(value >> self.CHUNK_BITS)
+            if lows is None:
+                lows = groups[value >> self.CHUNK_BITS] = set()
+            lows.add(value & (self.CHUNK_SIZE - 1))
+        for high, lows in groups.items():
+            if len(lows) <= self.ARRAY_MAX:
+                self._chunks[high] = array("H", sorted(lows))
+            else:
+                buffer = bytearray(self.CHUNK_SIZE // 8)
+                for low in lows:
+                    buffer[low >> 3] |= 1 << (low & 7)
+                self._chunks[high] = bytes(buffer)
+    
+    @classmethod
+    def _from_chunks(cls, chunks: dict) -> "IntBitmap":
+        """Wrap an existing chunk dict without copying it."""
+        bitmap = cls.__new__(cls)
+        bitmap._chunks = chunks
+        return bitmap
+    
+    @classmethod
+    def _and_containers(cls, left, right):
+        """Intersect two containers, returning None when nothing is shared."""
+        if type(left) is bytes and type(right) is bytes:
+            bits = int.from_bytes(left, "little") & int.from_bytes(right, "little")
+            if not bits:
+                return None
+            if bits.bit_count() > cls.ARRAY_MAX:
+                return bits.to_bytes(cls.CHUNK_SIZE // 8, "little")
+            return array("H", cls._bit_positions(bits))
+        if type(left) is bytes:
+            left, right = right, left
+        if type(right) is bytes:
+            common = array("H", [low for low in left if right[low >> 3] >> (low & 7) & 1])
+        else:
+            common = array("H", sorted(set(left).intersection(right)))
+        return common or None
+    
+    @staticmethod
+    def _bit_positions(bits: int):
+        """Yield the positions of the set bits of an int, lowest first."""
+        while bits:
+            # Isolate and clear the lowest set bit
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+    
+    @staticmethod
+    def _container_len(container) -> int:
+        if type(container) is bytes:
+            return int.from_bytes(container, "little").bit_count()
+        return len(container)
+    
+    def __contains__(self, value) -> bool:
+        container = self._chunks.get(value >> self.CHUNK_BITS)
+        if container is None:
+            return False
+        low = value & (self.CHUNK_SIZE - 1)
+        if type(container) is bytes:
+            return bool(container[low >> 3] >> (low & 7) & 1)
+        position = bisect_left(container, low)
+        return position < len(container) and container[position] == low
+    
+    def __len__(self) -> int:
+        return sum(map(self._container_len, self._chunks.values()))
+    
+    def __and__(self, other: "IntBitmap") -> "IntBitmap":
+        if len(self._chunks) > len(other._chunks):
+            self, other = other, self
+        chunks = {}
+        for high, container in self._chunks.items():
+            other_container = other._chunks.get(high)
+            if other_container is not None:
+                common = self._and_containers(container, other_container)
+                if common is not None:
+                    chunks[high] = common
+        return IntBitmap._from_chunks(chunks)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IntBitmap):
+            return NotImplemented
+        # Containers are canonical: arrays up to ARRAY_MAX, bitmaps above
+        return self._chunks == other._chunks
+    
+    def __iter__(self):
+        for high in sorted(self._chunks):
+            base = high << self.CHUNK_BITS
+            container = self._chunks[high]
+            if type(container) is bytes:
+                lows = self._bit_positions(int.from_bytes(container, "little"))
+            else:
+                lows = container
+            for low in lows:
+                yield base + low
+    
+    def __repr__(self) -> str:
+        return f"IntBitmap(size={len(self)}, chunks={len(self._chunks)})"
+    
+    def intersection_count(self, other: "IntBitmap") -> int:
+        """
+        Count the values present in both bitmaps.
+        
+        Parameters
+        ----------
+        other : IntBitmap
+            The bitmap to intersect with.
+        
+        Returns
+        -------
+        int
+            The size of the intersection.
+        """
+        if len(self._chunks) > len(other._chunks):
+            self, other = other, self
+        count = 0
+        for high, container in self._chunks.items():
+            other_container = other._chunks.get(high)
+            if other_container is None:
+                continue
+            if type(container) is bytes and type(other_container) is bytes:
+                count += (int.from_bytes(container, "little")
+                          & int.from_bytes(other_container, "little")).bit_count()
+            else:
+                common = self._and_containers(container, other_container)
+                count += len(common) if common is not None else 0
+        return count
+    
+    def tolist(self) -> list:
+        """
+        Return the stored values in ascending order.
+        
+        Returns
+        -------
+        list
+            The values as Python ints.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return list(self)
+        
+        result = []
+        for high in sorted(self._chunks):
+            container = self._chunks[high]
+            if type(container) is bytes:
+                bits = np.unpackbits(np.frombuffer(container, dtype=np.uint8), bitorder="little")
+                lows = np.flatnonzero(bits)
+            else:
+                lows = np.frombuffer(container, dtype=np.uint16).astype(np.int64)
+            result.extend((lows + (high << self.CHUNK_BITS)).tolist())
+        return result
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the chunk containers in bytes."""
+        return sum(len(container) if type(container) is bytes else 2 * len(container)
+                   for container in self._chunks.values())
 
 
-def run_performance_tests():
-    """Run performance comparison tests."""
-    import time
+def _common_bitmap(a, b, mode: str) -> list:
+    """Intersect integer inputs with chunked bitmaps."""
+    a_bitmap = a if isinstance(a, IntBitmap) else IntBitmap(a)
+    b_bitmap = b if isinstance(b, IntBitmap) else IntBitmap(b)
+    common = a_bitmap & b_bitmap
     
-    print("\n" + "="*100)
-    print("PERFORMANCE COMPARISON (Time in seconds)")
-    print("="*100)
+    if mode == "sorted" or isinstance(a, IntBitmap):
+        # A bitmap has no order or duplicates of its own to preserve
+        return common.tolist()
+    # Probe a set of the (small) intersection rather than the bitmap
+    common = set(common.tolist())
+    if mode == "unique":
+        return list(dict.fromkeys(element for element in a if element in common))
+    return [element for element in a if element in common]
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(key: int) -> int:
+    """Scramble a 64-bit key with the splitmix64 finalizer."""
+    key = (key + 0x9E3779B97F4A7C15) & _MASK64
+    key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return key ^ (key >> 31)
+
+
+# CPython reduces numeric hashes modulo this Mersenne prime
+_HASH_MODULUS = (1 << 61) - 1
+
+
+def _int_hash_array(np, values):
+    """Vectorized hash() of an integer array, as uint64 (wraps mod 2**64)."""
+    if values.dtype.kind == "u":
+        return values.astype(np.uint64) % np.uint64(_HASH_MODULUS)
+    values = values.astype(np.int64)
+    negative = values < 0
+    # |v| computed in uint64 so that the int64 minimum does not overflow
+    magnitude = np.where(negative, ~values.view(np.uint64) + np.uint64(1), values.view(np.uint64))
+    reduced = magnitude % np.uint64(_HASH_MODULUS)
+    # hash(-1) is -2 because -1 signals an error in CPython's C API
+    reduced[negative & (reduced == 1)] = 2
+    return np.where(negative, np.uint64(0) - reduced, reduced)
+
+
+def _mix64_array(np, keys):
+    """Vectorized _mix64 over a uint64 array (arithmetic wraps mod 2**64)."""
+    keys = keys + np.uint64(0x9E3779B97F4A7C15)
+    keys = (keys ^ (keys >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    keys = (keys ^ (keys >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return keys ^ (keys >> np.uint64(31))
+
+
+class BloomFilter:
+    """
+    A Bloom filter for cheaply ruling out elements before an exact check.
     
-    # Create test data
-    sizes = [100, 1000, 10000]
+    Membership answers never miss an added element, but may report an
+    element that was not added with probability close to `error_rate`.
+    Bit positions come from double hashing of a splitmix64-scrambled
+    ``hash()`` of each element, computed either per element or vectorized
+    over integer arrays. Since equal numbers hash equally, ``-1``, ``-1.0``
+    and ``np.int64(-1)`` all map to the same bits.
     
-    for size in sizes:
-        print(f"\nTest Size: {size} elements each")
-        print("-" * 100)
+    Attributes
+    ----------
+    num_bits : int
+        Size of the bit array.
+    num_hashes : int
+        Number of bit positions per element.
+    count : int
+        Number of elements added.
+    
+    Methods
+    -------
+    add_many(values):
+        Add every element of an iterable or integer array.
+    contains_many(values):
+        Return a membership mask for a list or integer array.
+    
+    Examples
+    --------
+    >>> bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    >>> bloom.add_many([1, 2, 3])
+    >>> 2 in bloom, 99 in bloom
+    (True, False)
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01, max_bytes: int = None):
+        """
+        Size a Bloom filter for an expected number of elements.
+        
+        Parameters
+        ----------
+        capacity : int
+            Expected number of elements to add.
+        error_rate : float
+            Target false-positive rate at full capacity.
+        max_bytes : int, optional
+            Upper bound on the bit array size; the error rate rises if
+            this is smaller than the target needs.
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        capacity = max(1, capacity)
+        num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        if max_bytes is not None:
+            num_bits = min(num_bits, max(8, max_bytes * 8))
+        self.num_bits = num_bits
+        self.num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((num_bits + 7) // 8)
+    
+    @property
+    def nbytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+    
+    @property
+    def expected_error_rate(self) -> float:
+        """False-positive rate expected for the elements added so far."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+    
+    def _positions(self, element) -> list:
+        """Return the bit positions of one element."""
+        first = _mix64(hash(element) & _MASK64)
+        step = _mix64(first ^ 0x5851F42D4C957F2D) | 1
+        return [((first + i * step) & _MASK64) % self.num_bits for i in range(self.num_hashes)]
+    
+    def _positions_array(self, np, values):
+        """Return a (num_hashes, n) array of bit positions for integers."""
+        first = _mix64_array(np, _int_hash_array(np, values))
+        step = _mix64_array(np, first ^ np.uint64(0x5851F42D4C957F2D)) | np.uint64(1)
+        hashes = np.arange(self.num_hashes, dtype=np.uint64)[:, None]
+        return (first + hashes * step) % np.uint64(self.num_bits)
+    
+    @staticmethod
+    def _integer_array(values):
+        """Return NumPy and values as an integer array, or (None, None)."""
+        if hasattr(values, "dtype"):
+            if values.dtype.kind not in "iu":
+                return None, None
+            import numpy as np
+            return np, values
+        if not isinstance(values, list) or not values or type(values[0]) is not int:
+            return None, None
+        try:
+            import numpy as np
+        except ImportError:
+            return None, None
+        # Lists of machine-sized ints are probed vectorized as well
+        array = np.asarray(values)
+        return (np, array) if array.dtype.kind in "iu" else (None, None)
+    
+    def add(self, element) -> None:
+        """Add one element."""
+        for position in self._positions(element):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def add_many(self, values) -> None:
+        """
+        Add every element of an iterable or integer array.
         
-        list_a = list(range(size))
-        list_b = list(range(size // 2, size + size // 2))
+        Parameters
+        ----------
+        values : iterable or numpy.ndarray
+            The elements to add.
+        """
+        np, array = self._integer_array(values)
+        if np is None:
+            for element in values:
+                self.add(element)
+            return
         
-        implementations = [
-            ("Original (Nested Loop)", find_common),
-            ("v2: Set Intersection", find_common_v2),
-            ("v3: List Comprehension", find_common_v3),
-            ("v5: Set with Order", find_common_v5),
-            ("v10: Two-Pointer", find_common_v10),
-        ]
+        positions = self._positions_array(np, array).ravel()
+        bits = np.frombuffer(self._bits, dtype=np.uint8)
+        np.bitwise_or.at(bits, positions >> np.uint64(3),
+                         np.left_shift(1, positions & np.uint64(7)).astype(np.uint8))
+        self.count += len(array)
+    
+    def __contains__(self, element) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] >> (position & 7) & 1
+                   for position in self._positions(element))
+    
+    def contains_many(self, values):
+        """
+        Test many elements at once.
         
-        for impl_name, impl_func in implementations:
-            start = time.time()
-            for _ in range(10):  # Run 10 times
-                result = impl_func(list_a, list_b)
-            elapsed = time.time() - start
-            
-            print(f"{impl_name:30} : {elapsed:.6f}s")
+        Parameters
+        ----------
+        values : list or numpy.ndarray
+            The elements to test.
+        
+        Returns
+        -------
+        list of bool or numpy.ndarray
+            A boolean mask, computed as an array for integer data.
+        """
+        np, array = self._integer_array(values)
+        if np is None:
+            return [element in self for element in values]
+        
+        positions = self._positions_array(np, array)
+        bits = np.frombuffer(self._bits, dtype=np.uint8)
+        hits = (bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return hits.all(axis=0)
 
 
-if __name__ == "__main__":
-    # Run comprehensive tests
-    run_comparison_tests()
+def _exact_is_cheap(a, b, mode: str, assume_sorted: bool) -> bool:
+    """
+    Return True if the exact intersection costs no more than a Bloom pass.
     
-    # Run performance tests
-    run_performance_tests()
\ No newline at end of file
+    Sets, IntBitmaps and NumPy arrays already answer membership in one
+    cheap lookup per element, and pre-sorted inputs in mode='sorted' are
+    merged in a single walk, so a prefilter would only add its own pass.
+    """
+    if assume_sorted and mode == "sorted":
+        return True
+    return any(isinstance(values, (set, frozenset, IntBitmap)) or hasattr(values, "dtype")
+               for values in (a, b))
+
+
+def _bloom_prefilter(a, b, mode: str, prefilter, strategy: str,
+                     assume_sorted: bool = False) -> list:
+    """Drop elements that cannot match with a Bloom filter, then intersect exactly."""
+    if isinstance(prefilter, BloomFilter):
+        # A reusable filter is built over b, the fixed side
+        bloom, build_side = prefilter, "b"
+    else:
+        build_side = "a" if len(a) < len(b) else "b"
+        built = a if build_side == "a" else b
+        bloom = BloomFilter(len(built))
+        bloom.add_many(built)
+    
+    probe = b if build_side == "a" else a
+    mask = bloom.contains_many(probe)
+    if hasattr(probe, "dtype"):
+        candidates = probe[mask]
+    elif hasattr(mask, "dtype"):
+        candidates = [probe[i] for i in mask.nonzero()[0].tolist()]
+    else:
+        candidates = [element for element, keep in zip(probe, mask) if keep]
+    
+    # Exact verification only sees the surviving candidates, which keep
+    # the order of the probed side, so assume_sorted still holds
+    if build_side == "a":
+        return find_common_auto(a, candidates, mode, strategy, assume_sorted)
+    return find_common_auto(candidates, b, mode, strategy, assume_sorted)
+
+
+# Result semantics supported by find_common_auto
+FIND_COMMON_MODES = ("filter", "unique", "sorted")
+
+# Minimum list size before converting Python lists to NumPy arrays pays off
+NUMPY_MIN_SIZE = 100_000
+
+
+def _common_hash(a, b, mode: str) -> list:
+    """Intersect with a hash set built over the smaller input."""
+    # Hash the smaller side and stream the larger side through it
+    if len(a) <= len(b):
+        common = set(a).intersection(b)
+    else:
+        common = set(b).intersection(a)
+    
+    if mode == "sorted":
+        return sorted(common)
+    if mode == "unique":
+        return list(dict.fromkeys(element for element in a if element in common))
+    return [element for element in a if element in common]
+
+
+def _common_merge(a, b, mode: str, assume_sorted: bool = False) -> list:
+    """Intersect with the sorted two-pointer walk of find_common_v10."""
+    if mode != "sorted":
+        raise ValueError("The merge strategy only supports mode='sorted'")
+    return find_common_v10(a, b, assume_sorted)
+
+
+def _run_starts(np, sorted_arr):
+    """Return a mask marking the first element of each run of equal values."""
+    starts = np.ones(len(sorted_arr), dtype=bool)
+    np.not_equal(sorted_arr[1:], sorted_arr[:-1], out=starts[1:])
+    return starts
+
+
+def _sorted_unique(np, arr):
+    """Return the distinct values of arr in ascending order."""
+    arr = np.sort(arr)
+    return arr[_run_starts(np, arr)]
+
+
+def _first_positions(np, arr, positions):
+    """Keep only the positions holding the first occurrence of each value."""
+    order = np.argsort(arr[positions], kind="stable")
+    firsts = order[_run_starts(np, arr[positions][order])]
+    return positions[np.sort(firsts)]
+
+
+def _sorted_contains(np, sorted_arr, values):
+    """Return a mask of which values occur in the sorted array."""
+    if len(sorted_arr) == 0:
+        return np.zeros(len(values), dtype=bool)
+    positions = np.searchsorted(sorted_arr, values)
+    positions[positions == len(sorted_arr)] = 0
+    return sorted_arr[positions] == values
+
+
+def _exact_numeric(values, arr) -> bool:
+    """Return True if arr is a numeric array holding values without rounding."""
+    kind = arr.dtype.kind
+    if kind not in "iuf":
+        return False
+    # A float array built from a list may hide ints rounded by promotion
+    return kind != "f" or hasattr(values, "dtype") or all(type(x) is float for x in values)
+
+
+def _same_numeric_kind(a, a_arr, b, b_arr) -> bool:
+    """Return True if NumPy can compare a and b without changing values."""
+    return (a_arr.dtype.kind == b_arr.dtype.kind
+            and _exact_numeric(a, a_arr) and _exact_numeric(b, b_arr))
+
+
+def _common_numpy(np, a, b, mode: str, exact: bool = False) -> list:
+    """
+    Intersect with vectorized NumPy sorting and membership masks.
+    
+    With exact=True, inputs whose dtypes NumPy would have to promote
+    (e.g. ints against floats) are handed to _common_hash instead, since
+    float64 cannot represent every int above 2**53.
+    """
+    a_arr = np.asarray(a)
+    b_arr = np.asarray(b)
+    if exact and not _same_numeric_kind(a, a_arr, b, b_arr):
+        return _common_hash(a, b, mode)
+    
+    if mode == "sorted":
+        unique_a = _sorted_unique(np, a_arr)
+        return unique_a[_sorted_contains(np, _sorted_unique(np, b_arr), unique_a)].tolist()
+    
+    # Positions in a whose value occurs in b, found by binary search with
+    # sorted queries; np.isin falls back to a much slower sort for wide ranges
+    order = np.argsort(a_arr)
+    found = np.empty(len(a_arr), dtype=bool)
+    found[order] = _sorted_contains(np, _sorted_unique(np, b_arr), a_arr[order])
+    positions = np.flatnonzero(found)
+    if mode == "unique":
+        positions = _first_positions(np, a_arr, positions)
+    if isinstance(a, list):
+        # Select the original objects so element types are preserved
+        return [a[i] for i in positions.tolist()]
+    return a_arr[positions].tolist()
+
+
+def _numeric_kind(np, values) -> str:
+    """Return the dtype kind of a numeric array or int/float list, else None."""
+    if hasattr(values, "dtype"):
+        kind = values.dtype.kind
+    elif not values or type(values[0]) not in (int, float):
+        return None
+    else:
+        kind = np.asarray(values[:1000]).dtype.kind
+    return kind if kind in "iuf" else None
+
+
+def _choose_strategy(a, b) -> str:
+    """Pick 'numpy' for large or array-typed numeric inputs of one kind, else 'hash'."""
+    try:
+        import numpy as np
+    except ImportError:
+        return "hash"
+    
+    is_array = hasattr(a, "dtype") or hasattr(b, "dtype")
+    is_large = min(len(a), len(b)) >= NUMPY_MIN_SIZE
+    if is_array or is_large:
+        # Mixing kinds would promote ints to float64 and lose precision
+        kind = _numeric_kind(np, a)
+        if kind is not None and kind == _numeric_kind(np, b):
+            return "numpy"
+    return "hash"
+
+
+def find_common_auto(a, b, mode: str = "filter", strategy: str = "auto",
+                     assume_sorted: bool = False, prefilter=None) -> list:
+    """
+    Find common elements, picking the fastest strategy for the input.
+    
+    Modes
+    -----
+    'filter'
+        Elements of `a` that occur in `b`, in the order and with the
+        duplicates of `a` (same as find_common_v5).
+    'unique'
+        Like 'filter' but keeping only the first occurrence of each
+        element (same as find_common_v6).
+    'sorted'
+        The distinct common elements in ascending order (same as
+        find_common_v10 and find_common_v9).
+    
+    Strategies
+    ----------
+    'hash'
+        Set built over the smaller input. Works for any hashable elements.
+    'merge'
+        Sorted two-pointer walk, galloping when the sizes are very
+        different. Only for mode='sorted'.
+    'numpy'
+        Vectorized sorting and membership masks on arrays. For numeric data.
+    'bitmap'
+        Chunked bitmaps (see IntBitmap) ANDed word by word. For integers.
+    'auto'
+        'numpy' for NumPy arrays or numeric lists of at least
+        NUMPY_MIN_SIZE elements when NumPy is installed, 'bitmap' when
+        either input is an IntBitmap and the other holds only integers
+        ('hash' over the bitmap's members otherwise), 'merge' for
+        pre-sorted lists in mode='sorted', otherwise 'hash'. Converting
+        very large Python lists dominates the 'numpy' cost, so pass
+        arrays directly when the data already lives in NumPy.
+    
+    Time Complexity: O(n + m) for 'hash', O(n log n + m log m) otherwise
+    Space Complexity: O(min(n, m)) for 'hash', O(n + m) otherwise
+    
+    Parameters
+    ----------
+    a : list or numpy.ndarray or IntBitmap
+        The first list.
+    b : list or numpy.ndarray or IntBitmap
+        The second list.
+    mode : str
+        One of FIND_COMMON_MODES.
+    strategy : str
+        'auto', 'hash', 'merge', 'numpy' or 'bitmap'.
+    assume_sorted : bool
+        Both inputs are already in ascending order, so 'merge' can skip
+        sorting them.
+    prefilter : bool or BloomFilter, optional
+        True builds a BloomFilter over the smaller input and uses it to
+        discard most non-matching elements of the larger one before the
+        exact intersection. A BloomFilter built over `b` can be passed
+        instead to reuse it across calls. Probing is vectorized for
+        integer data when NumPy is installed. The filter is skipped when
+        an input is a set, IntBitmap or NumPy array, or is pre-sorted in
+        mode='sorted', since the exact path is then already one cheap
+        pass. For in-memory lists a filter built per call is several
+        times slower than the plain hash path; it only pays off when a
+        filter over a fixed `b` is reused across many calls with few
+        matches, or when checking candidates exactly is expensive.
+    
+    Returns
+    -------
+    list
+        A list of common elements found in both lists.
+    
+    Examples
+    --------
+    >>> find_common_auto([4, 3, 3, 1], [3, 4, 5, 6])
+    [4, 3, 3]
+    >>> find_common_auto([4, 3, 3, 1], [3, 4, 5, 6], mode="sorted")
+    [3, 4]
+    """
+    if mode not in FIND_COMMON_MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {FIND_COMMON_MODES}")
+    
+    if (prefilter is not None and prefilter is not False
+            and not _exact_is_cheap(a, b, mode, assume_sorted)):
+        return _bloom_prefilter(a, b, mode, prefilter, strategy, assume_sorted)
+    
+    auto = strategy == "auto"
+    if auto:
+        if isinstance(a, IntBitmap) or isinstance(b, IntBitmap):
+            strategy = "bitmap"
+        elif assume_sorted and mode == "sorted" and not hasattr(a, "dtype"):
+            strategy = "merge"
+        else:
+            strategy = _choose_strategy(a, b)
+    
+    if strategy == "hash":
+        return _common_hash(a, b, mode)
+    if strategy == "merge":
+        return _common_merge(a, b, mode, assume_sorted)
+    if strategy == "numpy":
+        import numpy as np
+        # Lists only sampled by _choose_strategy are checked in full here
+        return _common_numpy(np, a, b, mode, exact=auto)
+    if strategy == "bitmap":
+        try:
+            return _common_bitmap(a, b, mode)
+        except (TypeError, OverflowError):
+            if not auto:
+                raise
+        # The other side is not all int64 integers, yet 2.0 still equals 2,
+        # so iterate the bitmap into a hash set instead
+        return _common_hash(a, b, mode)
+    raise ValueError(f"Unknown strategy '{strategy}'")
+
+
+def _intersect_pair(left: set, right: set) -> set:
+    """Intersect two sets; module-level so it can run in a worker process."""
+    return left & right
+
+
+def _common_tree(inputs: list, workers: int = None) -> set:
+    """Intersect inputs pairwise, level by level, in a process pool."""
+    level = [set(values) for values in inputs]
+    with ProcessPoolExecutor(workers) as executor:
+        while len(level) > 1:
+            # An odd input out is carried to the next level unchanged
+            carry = [level.pop()] if len(level) % 2 else []
+            level = list(executor.map(_intersect_pair, level[0::2], level[1::2])) + carry
+            if any(not common for common in level):
+                return set()
+    return level[0]
+
+
+def find_common_many(*iterables, mode: str = "unique", workers: int = 1) -> list:
+    """
+    Find the elements common to any number of iterables.
+    
+    Inputs are intersected from the smallest to the largest, so the running
+    intersection only shrinks, and the scan stops as soon as it is empty.
+    Only the smallest input is turned into a set; the others are streamed
+    through the running intersection without building intermediate lists.
+    
+    Time Complexity: O(total length) in the worst case
+    Space Complexity: O(size of the smallest input)
+    
+    Parameters
+    ----------
+    *iterables : iterable
+        The inputs. Iterables without a length are read into lists first.
+    mode : str
+        One of FIND_COMMON_MODES, applied relative to the first iterable.
+    workers : int
+        Number of worker processes; values above 1 (or None for the CPU
+        count) intersect the inputs as a parallel reduction tree instead.
+    
+    Returns
+    -------
+    list
+        A list of elements found in every input.
+    
+    Examples
+    --------
+    >>> find_common_many([5, 1, 2, 3, 1], [3, 1, 5], [1, 5, 9])
+    [5, 1]
+    """
+    if not iterables:
+        raise ValueError("find_common_many() needs at least one iterable")
+    if mode not in FIND_COMMON_MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {FIND_COMMON_MODES}")
+    
+    inputs = [values if hasattr(values, "__len__") else list(values) for values in iterables]
+    first = inputs[0]
+    
+    if workers != 1 and len(inputs) > 2:
+        common = _common_tree(inputs, workers)
+    else:
+        # Start from the smallest input and stop once nothing is left
+        ordered = sorted(inputs, key=len)
+        common = set(ordered[0])
+        for values in ordered[1:]:
+            if not common:
+                break
+            common = common.intersection(values)
+    
+    if mode == "sorted":
+        return sorted(common)
+    if mode == "unique":
+        return list(dict.fromkeys(element for element in first if element in common))
+    return [element for element in first if element in common]
+
+
+# Rough in-memory cost of one hashed element, used to size stream buckets
+STREAM_BYTES_PER_ELEMENT = 128
+
+# Deepest level of re-partitioning for buckets that still do not fit
+STREAM_MAX_LEVEL = 4
+
+
+def _iter_source(source):
+    """Yield the elements of an iterable, or the lines of a file path."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\n")
+    else:
+        yield from source
+
+
+def _iter_bucket(path: str):
+    """Yield the elements stored in a bucket file."""
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield from pickle.load(f)
+            except EOFError:
+                return
+
+
+def _partition(values, directory: str, side: str, partitions: int,
+               level: int, buffer_items: int) -> list:
+    """Hash-partition values into bucket files and return the bucket sizes."""
+    files = [open(os.path.join(directory, f"{side}{i}.bin"), "wb") for i in range(partitions)]
+    buffers = [[] for _ in range(partitions)]
+    counts = [0] * partitions
+    try:
+        for value in values:
+            # Salt the hash with the level so re-partitioning splits buckets
+            i = hash((level, value)) % partitions
+            buffers[i].append(value)
+            counts[i] += 1
+            if len(buffers[i]) >= buffer_items:
+                pickle.dump(buffers[i], files[i], protocol=pickle.HIGHEST_PROTOCOL)
+                buffers[i] = []
+        for f, buffer in zip(files, buffers):
+            if buffer:
+                pickle.dump(buffer, f, protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        for f in files:
+            f.close()
+    return counts
+
+
+def _stream_join(a, b, directory: str, partitions: int, max_items: int, level: int):
+    """Grace hash join of two element streams, yielding distinct matches."""
+    buffer_items = max(1, max_items // (2 * partitions))
+    a_counts = _partition(a, directory, "a", partitions, level, buffer_items)
+    b_counts = _partition(b, directory, "b", partitions, level, buffer_items)
+    
+    for i in range(partitions):
+        a_path = os.path.join(directory, f"a{i}.bin")
+        b_path = os.path.join(directory, f"b{i}.bin")
+        
+        if a_counts[i] and b_counts[i]:
+            # Build the hash table over the smaller side of the bucket pair
+            if a_counts[i] <= b_counts[i]:
+                build_path, probe_path, build_count = a_path, b_path, a_counts[i]
+            else:
+                build_path, probe_path, build_count = b_path, a_path, b_counts[i]
+            
+            if build_count > max_items and level < STREAM_MAX_LEVEL:
+                # Bucket does not fit in memory: split it again one level down
+                subdirectory = os.path.join(directory, str(i))
+                os.mkdir(subdirectory)
+                yield from _stream_join(_iter_bucket(a_path), _iter_bucket(b_path),
+                                        subdirectory, partitions, max_items, level + 1)
+            else:
+                build = set(_iter_bucket(build_path))
+                for value in _iter_bucket(probe_path):
+                    if value in build:
+                        # Discard so each common element is yielded once
+                        build.discard(value)
+                        yield value
+        
+        os.remove(a_path)
+        os.remove(b_path)
+
+
+def find_common_stream(a, b, max_memory: int = 256 * 1024 ** 2,
+                       partitions: int = 64, tmp_dir: str = None):
+    """
+    Find common elements of inputs that do not fit in memory.
+    
+    Both inputs are hash-partitioned into bucket files on disk (a grace
+    hash join). Each pair of matching buckets is then intersected on its
+    own, building a set over the smaller bucket only. Buckets whose set
+    would exceed the memory budget are partitioned again with a different
+    hash salt, up to STREAM_MAX_LEVEL times.
+    
+    Parameters
+    ----------
+    a : iterable or str or os.PathLike
+        The first input. A path is read line by line as strings.
+    b : iterable or str or os.PathLike
+        The second input. A path is read line by line as strings.
+    max_memory : int
+        Approximate peak memory budget in bytes, estimated with
+        STREAM_BYTES_PER_ELEMENT bytes per buffered or hashed element.
+    partitions : int
+        Number of buckets per partitioning level.
+    tmp_dir : str, optional
+        Directory for the bucket files. Defaults to the system temp dir.
+    
+    Yields
+    ------
+    object
+        Each distinct common element once, grouped by bucket.
+    
+    Examples
+    --------
+    >>> sorted(find_common_stream(iter([1, 2, 3, 4, 4]), iter([4, 3, 5, 6])))
+    [3, 4]
+    """
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1")
+    max_items = max(1, max_memory // STREAM_BYTES_PER_ELEMENT)
+    
+    # Bucket files are removed when the generator finishes or is closed
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        yield from _stream_join(_iter_source(a), _iter_source(b),
+                                directory, partitions, max_items, 0)
+
+
+class CommonIndex:
+    """
+    A prebuilt index over a fixed reference list for repeated intersections.
+    
+    The reference is indexed once, either as a sorted NumPy array (looked
+    up with vectorized binary search) or as a frozenset. Each
+    `common(query)` call then costs time proportional to the query only.
+    Sorted indexes can be saved as ``.npy`` files and memory-mapped back,
+    so a large reference does not have to be rebuilt or read into memory.
+    
+    Attributes
+    ----------
+    kind : str
+        'sorted' or 'hash'.
+    
+    Methods
+    -------
+    common(query, mode):
+        Find the query elements present in the reference.
+    save(path):
+        Write the index to disk.
+    load(path, mmap):
+        Read an index written by save.
+    
+    Examples
+    --------
+    >>> index = CommonIndex([1, 2, 3, 4], kind="hash")
+    >>> index.common([4, 9, 1, 4])
+    [4, 1, 4]
+    """
+    
+    def __init__(self, reference, kind: str = "auto"):
+        """
+        Build an index over a reference list.
+        
+        Parameters
+        ----------
+        reference : list or numpy.ndarray
+            The reference elements.
+        kind : str
+            'sorted', 'hash', or 'auto' to use 'sorted' when NumPy is
+            installed and every element converts to one numeric dtype
+            without rounding, and 'hash' otherwise.
+        """
+        if kind == "auto":
+            kind = "hash"
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            if np is not None and _numeric_kind(np, reference) is not None:
+                # The sample can miss strings, None or ints hidden in floats
+                arr = np.asarray(reference)
+                if _exact_numeric(reference, arr):
+                    kind = "sorted"
+                    self._values = _sorted_unique(np, arr)
+        elif kind == "sorted":
+            import numpy as np
+            self._values = _sorted_unique(np, np.asarray(reference))
+        
+        if kind == "hash":
+            self._values = frozenset(reference)
+        elif kind != "sorted":
+            raise ValueError(f"Unknown index kind '{kind}'")
+        self.kind = kind
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    def _exact_key(self, element):
+        """Return element converted exactly to the index dtype, or None."""
+        kind = self._values.dtype.kind
+        if kind not in "iuf":
+            return element
+        if not isinstance(element, numbers.Real):
+            return None
+        try:
+            if kind == "f":
+                key = float(element)
+                return key if key == element else None
+            if isinstance(element, numbers.Integral):
+                key = int(element)
+            elif float(element).is_integer():
+                key = int(element)
+            else:
+                return None
+        except OverflowError:
+            return None
+        import numpy as np
+        limits = np.iinfo(self._values.dtype)
+        return key if limits.min <= key <= limits.max else None
+    
+    def __contains__(self, element) -> bool:
+        if self.kind == "hash":
+            return element in self._values
+        key = self._exact_key(element)
+        if key is None:
+            return False
+        position = int(self._values.searchsorted(key))
+        return position < len(self._values) and self._values[position] == key
+    
+    def common(self, query, mode: str = "filter") -> list:
+        """
+        Find the query elements present in the reference.
+        
+        Parameters
+        ----------
+        query : list or numpy.ndarray
+            The elements to look up.
+        mode : str
+            One of FIND_COMMON_MODES, applied relative to the query.
+        
+        Returns
+        -------
+        list
+            The common elements.
+        """
+        if mode not in FIND_COMMON_MODES:
+            raise ValueError(f"Unknown mode '{mode}', expected one of {FIND_COMMON_MODES}")
+        
+        if self.kind == "hash":
+            values = self._values
+            if mode == "sorted":
+                return sorted(values.intersection(query))
+            if mode == "unique":
+                return list(dict.fromkeys(element for element in query if element in values))
+            return [element for element in query if element in values]
+        
+        import numpy as np
+        query_arr = np.asarray(query)
+        if query_arr.size == 0:
+            return []
+        if (self._values.dtype.kind in "iuf"
+                and (query_arr.dtype.kind != self._values.dtype.kind
+                     or not _exact_numeric(query, query_arr))):
+            # Strings or mixed numbers would be compared after conversion,
+            # so check each element exactly instead
+            elements = query.tolist() if hasattr(query, "dtype") else query
+            matches = [element for element in elements if element in self]
+            if mode == "sorted":
+                return sorted(set(matches))
+            if mode == "unique":
+                return list(dict.fromkeys(matches))
+            return matches
+        if mode == "sorted":
+            unique_query = _sorted_unique(np, query_arr)
+            return unique_query[_sorted_contains(np, self._values, unique_query)].tolist()
+        
+        positions = np.flatnonzero(_sorted_contains(np, self._values, query_arr))
+        if mode == "unique":
+            positions = _first_positions(np, query_arr, positions)
+        if isinstance(query, list):
+            return [query[i] for i in positions.tolist()]
+        return query_arr[positions].tolist()
+    
+    def save(self, path: str) -> None:
+        """
+        Write the index to disk.
+        
+        Sorted indexes are written with ``np.save``; hash indexes are
+        pickled.
+        
+        Parameters
+        ----------
+        path : str
+            The destination file.
+        """
+        with open(path, "wb") as f:
+            if self.kind == "sorted":
+                import numpy as np
+                np.save(f, self._values, allow_pickle=False)
+            else:
+                pickle.dump(self._values, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "CommonIndex":
+        """
+        Read an index written by `save`.
+        
+        Parameters
+        ----------
+        path : str
+            The file written by save.
+        mmap : bool
+            Memory-map a sorted index read-only instead of reading it.
+        
+        Returns
+        -------
+        CommonIndex
+            The loaded index.
+        """
+        index = cls.__new__(cls)
+        with open(path, "rb") as f:
+            is_npy = f.read(6) == b"\x93NUMPY"
+        
+        if is_npy:
+            import numpy as np
+            index._values = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+            index.kind = "sorted"
+        else:
+            with open(path, "rb") as f:
+                index._values = pickle.load(f)
+            index.kind = "hash"
+        return index
+
+
+def _partition_key(value) -> int:
+    """
+    Return a bucketing key that is the same in every worker process.
+    
+    str and bytes hashes are randomized per process, so they are keyed by
+    CRC-32 instead; tuples combine the keys of their items. Everything
+    else uses hash(), which is stable for numbers and keeps equal numbers
+    of different types together.
+    """
+    if isinstance(value, str):
+        return zlib.crc32(value.encode("utf-8", "surrogatepass"))
+    if isinstance(value, (bytes, bytearray)):
+        return zlib.crc32(value)
+    if isinstance(value, tuple):
+        key = len(value)
+        for item in value:
+            key = _mix64((key ^ _partition_key(item)) & _MASK64)
+        return key
+    return hash(value)
+
+
+def _has_stable_keys(values) -> bool:
+    """
+    Return True if _partition_key gives every value the same key in every process.
+    
+    Only numbers, str, bytes and tuples of those qualify; hash() of other
+    types such as datetimes or frozensets of str is randomized per process.
+    """
+    stack = list(values)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, tuple):
+            stack.extend(value)
+        elif not isinstance(value, (numbers.Number, str, bytes, bytearray)):
+            return False
+    return True
+
+
+def _partition_slice(values: list, offset: int, partitions: int) -> list:
+    """Split one slice of a list into buckets of (values, original indices)."""
+    buckets = [([], []) for _ in range(partitions)]
+    for i, value in enumerate(values, offset):
+        bucket_values, bucket_indices = buckets[_mix64(_partition_key(value) & _MASK64) % partitions]
+        bucket_values.append(value)
+        bucket_indices.append(i)
+    return buckets
+
+
+def _intersect_partition(a_parts: list, b_parts: list) -> list:
+    """Return the indices of a bucket of a whose values occur in b's bucket."""
+    b_set = set()
+    for values, _ in b_parts:
+        b_set.update(values)
+    matches = []
+    for values, indices in a_parts:
+        matches.extend(i for i, value in zip(indices, values) if value in b_set)
+    return sorted(matches)
+
+
+def _partition_shard(name: str, index_name: str, size: int, start: int, stop: int,
+                     partitions: int) -> list:
+    """
+    Reorder rows [start, stop) of a shared int64 block by bucket, in place.
+    
+    With an index block, the original position of every row is written
+    next to it. Returns the number of rows in each bucket.
+    """
+    import numpy as np
+    from multiprocessing.shared_memory import SharedMemory
+    
+    blocks = [SharedMemory(name=name)]
+    if index_name is not None:
+        blocks.append(SharedMemory(name=index_name))
+    try:
+        values = np.ndarray((size,), np.int64, buffer=blocks[0].buf)[start:stop]
+        bucket_ids = _mix64_array(np, _int_hash_array(np, values)) % np.uint64(partitions)
+        # Narrow ids sort much faster; a stable sort keeps rows in order per bucket
+        bucket_ids = bucket_ids.astype(np.uint16 if partitions <= 1 << 16 else np.int64)
+        order = np.argsort(bucket_ids, kind="stable")
+        counts = np.bincount(bucket_ids, minlength=partitions)
+        values[:] = values[order]
+        if index_name is not None:
+            indices = np.ndarray((size,), np.int64, buffer=blocks[1].buf)[start:stop]
+            indices[:] = order + start
+            del indices
+        # Views must be released before the blocks can be closed
+        del values
+    finally:
+        for block in blocks:
+            block.close()
+    return counts.tolist()
+
+
+def _intersect_shard(names: tuple, sizes: tuple, a_offsets: list, b_offsets: list,
+                     bucket: int) -> "numpy.ndarray":
+    """Return the positions in a of one bucket's matches, gathered from every shard."""
+    import numpy as np
+    from multiprocessing.shared_memory import SharedMemory
+    
+    blocks = [SharedMemory(name=name) for name in names]
+    try:
+        a_values = np.ndarray((sizes[0],), np.int64, buffer=blocks[0].buf)
+        b_values = np.ndarray((sizes[1],), np.int64, buffer=blocks[1].buf)
+        a_indices = np.ndarray((sizes[0],), np.int64, buffer=blocks[2].buf)
+        # Each shard holds the bucket as one contiguous run
+        a_runs = [slice(offsets[bucket], offsets[bucket + 1]) for offsets in a_offsets]
+        b_runs = [slice(offsets[bucket], offsets[bucket + 1]) for offsets in b_offsets]
+        a_bucket = np.concatenate([a_values[run] for run in a_runs])
+        b_bucket = np.concatenate([b_values[run] for run in b_runs])
+        # Binary search with sorted queries; np.isin falls back to a much
+        # slower sort for buckets spanning a wide range of values
+        order = np.argsort(a_bucket)
+        found = np.empty(len(a_bucket), dtype=bool)
+        found[order] = _sorted_contains(np, _sorted_unique(np, b_bucket), a_bucket[order])
+        matches = np.concatenate([a_indices[run] for run in a_runs])[found]
+        del a_values, b_values, a_indices
+    finally:
+        for block in blocks:
+            block.close()
+    return matches
+
+
+def _shard_bounds(size: int, shards: int) -> list:
+    """Split range(size) into up to `shards` contiguous (start, stop) pairs."""
+    step = max(1, -(-size // shards))
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _shard_offsets(bounds: list, counts: list) -> list:
+    """Turn per-shard bucket counts into absolute bucket boundaries."""
+    offsets = []
+    for (start, _), shard_counts in zip(bounds, counts):
+        shard_offsets = [start]
+        for count in shard_counts:
+            shard_offsets.append(shard_offsets[-1] + count)
+        offsets.append(shard_offsets)
+    return offsets
+
+
+def _common_positions_shared(np, pool, a_arr, b_arr, workers: int, partitions: int):
+    """Intersect int64 arrays in two parallel passes over shared memory."""
+    from multiprocessing.shared_memory import SharedMemory
+    
+    sizes = (len(a_arr), len(b_arr))
+    # Shared blocks for a, b (reordered in place) and a's original positions
+    blocks = [SharedMemory(create=True, size=max(1, size * 8)) for size in (*sizes, sizes[0])]
+    try:
+        np.ndarray(sizes[0], np.int64, buffer=blocks[0].buf)[:] = a_arr
+        np.ndarray(sizes[1], np.int64, buffer=blocks[1].buf)[:] = b_arr
+        names = tuple(block.name for block in blocks)
+        
+        # Pass 1: every worker partitions its own shard of each input
+        a_bounds = _shard_bounds(sizes[0], workers)
+        b_bounds = _shard_bounds(sizes[1], workers)
+        a_futures = [pool.submit(_partition_shard, names[0], names[2], sizes[0],
+                                 start, stop, partitions) for start, stop in a_bounds]
+        b_futures = [pool.submit(_partition_shard, names[1], None, sizes[1],
+                                 start, stop, partitions) for start, stop in b_bounds]
+        a_offsets = _shard_offsets(a_bounds, [future.result() for future in a_futures])
+        b_offsets = _shard_offsets(b_bounds, [future.result() for future in b_futures])
+        
+        # Pass 2: every bucket is intersected from its runs in all shards
+        matches = list(pool.map(_intersect_shard, [names] * partitions, [sizes] * partitions,
+                                [a_offsets] * partitions, [b_offsets] * partitions,
+                                range(partitions)))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return np.sort(np.concatenate(matches))
+
+
+def _common_positions_lists(pool, a, b, workers: int, partitions: int) -> list:
+    """Intersect lists in two parallel passes over pickled shards."""
+    a_bounds = _shard_bounds(len(a), workers)
+    b_bounds = _shard_bounds(len(b), workers)
+    
+    # Pass 1: every worker partitions its own shard of each input
+    a_shards = list(pool.map(_partition_slice, [a[start:stop] for start, stop in a_bounds],
+                             [start for start, _ in a_bounds], [partitions] * len(a_bounds)))
+    b_shards = list(pool.map(_partition_slice, [b[start:stop] for start, stop in b_bounds],
+                             [start for start, _ in b_bounds], [partitions] * len(b_bounds)))
+    
+    # Pass 2: every bucket is intersected from its parts in all shards
+    matches = pool.map(_intersect_partition,
+                       [[shard[p] for shard in a_shards] for p in range(partitions)],
+                       [[shard[p] for shard in b_shards] for p in range(partitions)])
+    # Each bucket's positions are ascending, so merging restores a's order
+    return list(merge(*matches))
+
+
+def _free_threaded() -> bool:
+    """Return True on a free-threaded (no GIL) Python build."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def find_common_partitioned(a, b, mode: str = "filter", partitions: int = None,
+                            workers: int = None, executor: str = "auto") -> list:
+    """
+    Find common elements by intersecting hash partitions concurrently.
+    
+    The work runs in two parallel passes and the parent does no hashing.
+    First every worker hash-partitions its own shard of each input, so
+    matching elements always land in the same bucket. Then every bucket
+    is intersected from its parts in all shards, returning the positions
+    of its matches in `a`. The positions are merged in order, so the
+    result is deterministic and follows the same modes as find_common_auto.
+    
+    Integer inputs are placed in `multiprocessing.shared_memory` blocks
+    that workers reorder in place, so only block names, shard bounds and
+    bucket counts cross process boundaries. Other inputs are pickled to
+    the workers, which only pays off with threads on free-threaded builds.
+    Elements whose hash differs between processes (anything but numbers,
+    str, bytes and tuples of those) always use threads.
+    
+    Time Complexity: O(n + m) work, split across the workers
+    Space Complexity: O(n + m)
+    
+    Parameters
+    ----------
+    a : list or numpy.ndarray
+        The first list.
+    b : list or numpy.ndarray
+        The second list.
+    mode : str
+        One of FIND_COMMON_MODES.
+    partitions : int, optional
+        Number of buckets. Defaults to four per worker.
+    workers : int, optional
+        Pool size and number of shards per input. Defaults to the CPU count.
+    executor : str
+        'process', 'thread', or 'auto' to use threads only on
+        free-threaded builds where they run in parallel.
+    
+    Returns
+    -------
+    list
+        A list of common elements found in both lists.
+    
+    Examples
+    --------
+    >>> find_common_partitioned([4, 3, 3, 1], [3, 4, 5, 6], workers=2, executor="thread")
+    [4, 3, 3]
+    """
+    if mode not in FIND_COMMON_MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {FIND_COMMON_MODES}")
+    workers = workers or os.cpu_count() or 1
+    partitions = partitions or 4 * workers
+    if executor == "auto":
+        executor = "thread" if _free_threaded() else "process"
+    pool_class = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}.get(executor)
+    if pool_class is None:
+        raise ValueError(f"Unknown executor '{executor}'")
+    
+    if len(a) == 0 or len(b) == 0:
+        return []
+    
+    # Integer data of one kind that fits in int64 goes through shared memory
+    arrays = None
+    try:
+        import numpy as np
+        from multiprocessing.shared_memory import SharedMemory  # noqa: F401
+        if _numeric_kind(np, a) in ("i", "u") and _numeric_kind(np, b) in ("i", "u"):
+            a_arr, b_arr = np.asarray(a), np.asarray(b)
+            if (all(arr.dtype.kind in "iu" for arr in (a_arr, b_arr))
+                    and all(arr.dtype.kind == "i" or not arr.size or arr.max() < 2**63
+                            for arr in (a_arr, b_arr))):
+                arrays = a_arr, b_arr
+    except ImportError:
+        pass
+    
+    # Keys of other types differ between processes, so they stay on threads
+    if (pool_class is ProcessPoolExecutor and arrays is None
+            and not (_has_stable_keys(a) and _has_stable_keys(b))):
+        pool_class = ThreadPoolExecutor
+    
+    with pool_class(workers) as pool:
+        if arrays is not None:
+            positions = _common_positions_shared(np, pool, *arrays, workers, partitions)
+        else:
+            positions = _common_positions_lists(pool, a, b, workers, partitions)
+    
+    if arrays is None:
+        common = [a[i] for i in positions]
+    elif hasattr(a, "dtype"):
+        common = a[positions].tolist()
+    else:
+        # Select the original objects so element types are preserved
+        common = [a[i] for i in positions.tolist()]
+    
+    if mode == "sorted":
+        return sorted(set(common))
+    if mode == "unique":
+        return list(dict.fromkeys(common))
+    return common
+
+
+# Input sizes for the partitioned scaling curve; 100M needs several GB
+PARTITION_BENCHMARK_SIZES = (1_000_000, 10_000_000, 100_000_000)
+
+
+def benchmark_partitioned(sizes=PARTITION_BENCHMARK_SIZES, max_workers: int = None) -> list:
+    """
+    Measure find_common_partitioned from 1 worker up to max_workers.
+    
+    Parameters
+    ----------
+    sizes : iterable of int
+        Input sizes to measure; each side gets this many elements.
+    max_workers : int, optional
+        Largest worker count. Defaults to the CPU count.
+    
+    Returns
+    -------
+    list of dict
+        'size', 'workers', 'seconds' and 'speedup' per measurement.
+    """
+    import random
+    import time
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    
+    rows = []
+    for size in sizes:
+        if np is not None:
+            rng = np.random.default_rng(size)
+            a, b = rng.integers(0, 2 * size, size), rng.integers(0, 2 * size, size)
+        else:
+            rng = random.Random(size)
+            a = [rng.randrange(2 * size) for _ in range(size)]
+            b = [rng.randrange(2 * size) for _ in range(size)]
+        
+        baseline = None
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            find_common_partitioned(a, b, workers=workers)
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+            rows.append({"size": size, "workers": workers, "seconds": seconds,
+                         "speedup": baseline / seconds})
+        del a, b
+    return rows
+
+
+class LiveIntersection:
+    """
+    The common elements of two changing multisets, kept up to date.
+    
+    Each side keeps a reference count per element, and a third dict holds
+    the elements present on both sides together with their count on side
+    A. Every add or remove touches only these dicts, so updates are O(1)
+    and the current intersection is always available. As a multiset the
+    result matches ``find_common_v5(a, b)``: each common element appears
+    as many times as it occurs in A.
+    
+    Methods
+    -------
+    add_a(element), remove_a(element):
+        Insert or delete one occurrence on side A.
+    add_b(element), remove_b(element):
+        Insert or delete one occurrence on side B.
+    apply(events):
+        Replay (side, op, element) events.
+    common():
+        Return the distinct common elements.
+    to_list():
+        Return the common elements with A's multiplicities.
+    
+    Examples
+    --------
+    >>> live = LiveIntersection()
+    >>> live.add_a(1); live.add_a(1); live.add_a(2); live.add_b(1)
+    >>> live.to_list()
+    [1, 1]
+    >>> live.remove_b(1)
+    >>> live.to_list()
+    []
+    """
+    
+    def __init__(self, a=(), b=()):
+        """
+        Initialize a LiveIntersection object.
+        
+        Parameters
+        ----------
+        a : iterable, optional
+            Initial elements of side A.
+        b : iterable, optional
+            Initial elements of side B.
+        """
+        self._a = {}
+        self._b = {}
+        # Elements on both sides, mapped to their count on side A
+        self._common = {}
+        for element in a:
+            self.add_a(element)
+        for element in b:
+            self.add_b(element)
+    
+    def add_a(self, element) -> None:
+        """Add one occurrence of element to side A."""
+        count = self._a.get(element, 0) + 1
+        self._a[element] = count
+        if element in self._b:
+            self._common[element] = count
+    
+    def remove_a(self, element) -> None:
+        """Remove one occurrence of element from side A; KeyError if absent."""
+        count = self._a[element] - 1
+        if count:
+            self._a[element] = count
+            if element in self._common:
+                self._common[element] = count
+        else:
+            del self._a[element]
+            self._common.pop(element, None)
+    
+    def add_b(self, element) -> None:
+        """Add one occurrence of element to side B."""
+        count = self._b.get(element, 0)
+        self._b[element] = count + 1
+        if not count and element in self._a:
+            self._common[element] = self._a[element]
+    
+    def remove_b(self, element) -> None:
+        """Remove one occurrence of element from side B; KeyError if absent."""
+        count = self._b[element] - 1
+        if count:
+            self._b[element] = count
+        else:
+            del self._b[element]
+            self._common.pop(element, None)
+    
+    def apply(self, events) -> None:
+        """
+        Replay a sequence of change events.
+        
+        Parameters
+        ----------
+        events : iterable of tuple
+            ``(side, op, element)`` with side 'a' or 'b' and op 'add' or
+            'remove'.
+        """
+        handlers = {("a", "add"): self.add_a, ("a", "remove"): self.remove_a,
+                    ("b", "add"): self.add_b, ("b", "remove"): self.remove_b}
+        for side, op, element in events:
+            try:
+                handler = handlers[side, op]
+            except KeyError:
+                raise ValueError(f"Unknown event ({side!r}, {op!r})") from None
+            handler(element)
+    
+    def __contains__(self, element) -> bool:
+        return element in self._common
+    
+    def __len__(self) -> int:
+        return len(self._common)
+    
+    def common(self) -> set:
+        """
+        Return the distinct elements currently on both sides.
+        
+        Returns
+        -------
+        set
+            A snapshot of the common elements.
+        """
+        return set(self._common)
+    
+    def to_list(self) -> list:
+        """
+        Return the common elements repeated by their count on side A.
+        
+        Returns
+        -------
+        list
+            The multiset find_common_v5 would return, grouped by element.
+        """
+        return [element for element, count in self._common.items() for _ in range(count)]
+
+
+# Input shapes generated by benchmark_find_common
+BENCHMARK_SHAPES = ("integers", "strings", "tuples", "duplicates", "skewed")
+
+# Input sizes for benchmark_find_common; 10M lists need a few GB
+FIND_COMMON_BENCHMARK_SIZES = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+def _benchmark_variants() -> list:
+    """Return (name, function, is_quadratic, uses_arrays) for every implementation."""
+    return [
+        ("find_common", find_common, True, False),
+        ("find_common_v2", find_common_v2, False, False),
+        ("find_common_v3", find_common_v3, True, False),
+        ("find_common_v4", find_common_v4, True, False),
+        ("find_common_v5", find_common_v5, False, False),
+        ("find_common_v6", find_common_v6, False, False),
+        ("find_common_v7", find_common_v7, False, False),
+        ("find_common_v8", find_common_v8, True, False),
+        ("find_common_v9", find_common_v9, False, False),
+        ("find_common_v10", find_common_v10, False, False),
+        ("find_common_v11", find_common_v11, False, True),
+        ("find_common_auto", find_common_auto, False, False),
+        ("find_common_partitioned", find_common_partitioned, False, True),
+    ]
+
+
+def _benchmark_data(shape: str, size: int, seed: int = 0) -> tuple:
+    """Build the two input lists for one benchmark shape and size."""
+    import random
+    
+    rng = random.Random(seed)
+    
+    def ints(count, upper):
+        return [rng.randrange(upper) for _ in range(count)]
+    
+    if shape == "integers":
+        return ints(size, 2 * size), ints(size, 2 * size)
+    if shape == "strings":
+        return ([f"id{x}" for x in ints(size, 2 * size)],
+                [f"id{x}" for x in ints(size, 2 * size)])
+    if shape == "tuples":
+        return ([(x % 1000, x // 1000) for x in ints(size, 2 * size)],
+                [(x % 1000, x // 1000) for x in ints(size, 2 * size)])
+    if shape == "duplicates":
+        # Roughly a hundred copies of each value
+        distinct = max(1, size // 100)
+        return ints(size, 2 * distinct), ints(size, 2 * distinct)
+    if shape == "skewed":
+        return ints(max(1, size // 100), 2 * size), ints(size, 2 * size)
+    raise ValueError(f"Unknown benchmark shape '{shape}'")
+
+
+def benchmark_find_common(sizes=FIND_COMMON_BENCHMARK_SIZES, shapes=BENCHMARK_SHAPES,
+                          repeats: int = 7, warmup: int = 1, memory: bool = True,
+                          quadratic_max_size: int = 10000) -> list:
+    """
+    Benchmark every find_common implementation across sizes and shapes.
+    
+    Each implementation is warmed up, then timed `repeats` times with
+    `time.perf_counter`. Peak memory is measured in a separate run under
+    tracemalloc so that tracing does not distort the timings; it does not
+    include memory used inside worker processes. Implementations built
+    for NumPy are given the same data as arrays, converted outside the
+    timed runs, and are skipped for shapes that do not form a numeric array.
+    
+    Parameters
+    ----------
+    sizes : iterable of int
+        Number of elements in each input (the smaller one for 'skewed').
+    shapes : iterable of str
+        Names from BENCHMARK_SHAPES.
+    repeats : int
+        Number of timed runs per measurement.
+    warmup : int
+        Number of untimed runs before measuring.
+    memory : bool
+        Also record peak traced memory.
+    quadratic_max_size : int
+        Largest size at which the O(n * m) implementations are run.
+    
+    Returns
+    -------
+    list of dict
+        One row per implementation, shape and size with 'median_s',
+        'iqr_s', 'elements_per_s' and 'peak_bytes', or a 'skipped' reason.
+    """
+    import statistics
+    import time
+    import tracemalloc
+    
+    if repeats < 2:
+        raise ValueError("repeats must be at least 2")
+    
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    
+    rows = []
+    for shape in shapes:
+        for size in sizes:
+            list_a, list_b = _benchmark_data(shape, size)
+            elements = len(list_a) + len(list_b)
+            arrays = None
+            if np is not None:
+                arrays = np.asarray(list_a), np.asarray(list_b)
+                if not all(arr.ndim == 1 and arr.dtype.kind in "iuf" for arr in arrays):
+                    arrays = None
+            for name, func, is_quadratic, uses_arrays in _benchmark_variants():
+                row = {"implementation": name, "shape": shape, "size": size}
+                rows.append(row)
+                if is_quadratic and size > quadratic_max_size:
+                    row["skipped"] = "quadratic"
+                    continue
+                if name == "find_common_v9" and shape == "tuples":
+                    # np.intersect1d flattens tuples into their fields
+                    row["skipped"] = "unsupported"
+                    continue
+                if uses_arrays and arrays is None:
+                    row["skipped"] = "unsupported" if np is not None else "numpy not installed"
+                    continue
+                
+                inputs = arrays if uses_arrays else (list_a, list_b)
+                for _ in range(warmup):
+                    func(*inputs)
+                samples = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    func(*inputs)
+                    samples.append(time.perf_counter() - start)
+                
+                q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+                row.update({
+                    "median_s": median,
+                    "iqr_s": q3 - q1,
+                    "elements_per_s": elements / median if median > 0 else float("inf"),
+                })
+                
+                if memory:
+                    tracemalloc.start()
+                    try:
+                        func(*inputs)
+                        row["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                    finally:
+                        tracemalloc.stop()
+    return rows
+
+
+def write_benchmark_results(rows: list, path: str) -> None:
+    """
+    Export benchmark rows as CSV or JSON, chosen by the file suffix.
+    
+    Parameters
+    ----------
+    rows : list of dict
+        Rows from benchmark_find_common.
+    path : str
+        Destination ending in '.csv' or '.json'.
+    """
+    if path.endswith(".json"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+    elif path.endswith(".csv"):
+        fields = ["implementation", "shape", "size", "median_s", "iqr_s",
+                  "elements_per_s", "peak_bytes", "skipped"]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        raise ValueError("Benchmark results path must end in '.csv' or '.json'")
+
+
+# Comprehensive Testing
+def run_comparison_tests():
+    """Run comprehensive tests comparing all implementations."""
+    
+    test_cases = [
+        ([1, 2, 3, 4], [3, 4, 5, 6], "Basic case"),
+        ([1, 1, 2, 2, 3, 3], [2, 2, 3, 3, 4], "Duplicates"),
+        ([], [1, 2, 3], "Empty first list"),
+        ([1, 2, 3], [], "Empty second list"),
+        ([], [], "Both empty"),
+        ([1, 2, 3], [1, 2, 3], "Identical lists"),
+        ([1, 2, 3], [4, 5, 6], "No common elements"),
+        (['a', 'b', 'c'], ['b', 'c', 'd'], "String elements"),
+        ([1, 2, 3, 4, 5], [5, 4, 3, 2, 1], "Reversed order"),
+        (list(range(1000)), list(range(500, 1500)), "Large lists"),
+    ]
+    
+    implementations = [
+        ("Original (Nested Loop)", find_common),
+        ("v2: Set Intersection", find_common_v2),
+        ("v3: List Comprehension", find_common_v3),
+        ("v4: Filter + Lambda", find_common_v4),
+        ("v5: Set with Order", find_common_v5),
+        ("v6: Dict.fromkeys", find_common_v6),
+        ("v7: Set Operations", find_common_v7),
+        ("v8: Any() Generator", find_common_v8),
+        ("v9: NumPy (if available)", find_common_v9),
+        ("v10: Two-Pointer", find_common_v10),
+    ]
+    
+    print("="*100)
+    print("COMPREHENSIVE OPTIMIZATION TEST - Find Common Elements")
+    print("="*100)
+    
+    for test_num, (list_a, list_b, description) in enumerate(test_cases, 1):
+        print(f"\nTest Case {test_num}: {description}")
+        print(f"List A: {list_a if len(str(list_a)) < 50 else str(list_a)[:50] + '...'}")
+        print(f"List B: {list_b if len(str(list_b)) < 50 else str(list_b)[:50] + '...'}")
+        print("-" * 100)
+        
+        results = {}
+        for impl_name, impl_func in implementations:
+            try:
+                result = impl_func(list_a, list_b)
+                results[impl_name] = result
+                status = "✓"
+                print(f"{status} {impl_name:30} : {result if len(str(result)) < 60 else str(result)[:60] + '...'}")
+            except Exception as e:
+                results[impl_name] = f"ERROR: {str(e)[:50]}"
+                print(f"✗ {impl_name:30} : ERROR - {str(e)[:50]}")
+        
+        # Verify all results match original
+        original_result = results.get("Original (Nested Loop)")
+        all_match = all(
+            result == original_result 
+            for name, result in results.items() 
+            if not isinstance(result, str) or not result.startswith("ERROR")
+        )
+        
+        print(f"Consistency: {'✓ All match' if all_match else '✗ Mismatch detected'}")
+
+
+def run_performance_tests(output_path: str = None):
+    """Run the benchmark suite and print median, IQR, throughput and memory."""
+    print("\n" + "="*100)
+    print("PERFORMANCE COMPARISON")
+    print("="*100)
+    
+    # The larger sizes take minutes, so the self-check stops at 10,000
+    rows = benchmark_find_common(sizes=FIND_COMMON_BENCHMARK_SIZES[:3], repeats=5,
+                                 quadratic_max_size=1000)
+    
+    current = None
+    for row in rows:
+        if (row["shape"], row["size"]) != current:
+            current = (row["shape"], row["size"])
+            print(f"\nShape: {row['shape']} | Size: {row['size']:,}")
+            print("-" * 100)
+        if "skipped" in row:
+            print(f"{row['implementation']:23} : skipped ({row['skipped']})")
+            continue
+        print(f"{row['implementation']:23} : median {row['median_s']:.6f}s | "
+              f"IQR {row['iqr_s']:.6f}s | {row['elements_per_s']:>14,.0f} elem/s | "
+              f"peak {row.get('peak_bytes', 0):>11,} B")
+    
+    if output_path is not None:
+        write_benchmark_results(rows, output_path)
+
+
+def run_engine_tests():
+    """Check find_common_auto against the reference implementations."""
+    import random
+    import time
+    
+    print("\n" + "="*100)
+    print("FIND_COMMON_AUTO ENGINE TEST")
+    print("="*100)
+    
+    test_cases = [
+        ([1, 2, 3, 4], [3, 4, 5, 6], "Basic case"),
+        ([1, 1, 2, 2, 3, 3], [2, 2, 3, 3, 4], "Duplicates"),
+        ([], [1, 2, 3], "Empty first list"),
+        ([1, 2, 3], [], "Empty second list"),
+        (['a', 'b', 'c'], ['b', 'c', 'd'], "String elements"),
+        ([5, 4, 3, 2, 1, 5], [1, 2, 3, 4, 5], "Reversed order"),
+        (list(range(200000, 0, -1)), list(range(100000, 300000)), "Large lists"),
+    ]
+    references = {"filter": find_common_v5, "unique": find_common_v6, "sorted": find_common_v10}
+    strategies = ["auto", "hash", "merge", "numpy", "bitmap"]
+    
+    for list_a, list_b, description in test_cases:
+        failures = []
+        for mode, reference in references.items():
+            expected = reference(list_a, list_b)
+            for strategy in strategies:
+                if strategy == "merge" and mode != "sorted":
+                    continue
+                if strategy in ("numpy", "bitmap") and isinstance((list_a or list_b)[0], str):
+                    continue
+                try:
+                    result = find_common_auto(list_a, list_b, mode, strategy)
+                except ImportError:
+                    continue
+                if result != expected:
+                    failures.append(f"{mode}/{strategy}")
+        status = "✓ All modes match" if not failures else f"✗ Mismatch: {', '.join(failures)}"
+        print(f"{description:20} : {status}")
+    
+    # Ints above 2**53 must not match floats they only round to
+    list_a = [2**53 + 1] * NUMPY_MIN_SIZE + [3]
+    list_b = [float(2**53)] * NUMPY_MIN_SIZE + [3.0]
+    match = all(find_common_auto(list_a, list_b, mode) == reference(list_a, list_b)
+                for mode, reference in references.items())
+    status = "✓ All modes match" if match else "✗ Mismatch"
+    print(f"{'Mixed int/float':20} : {status}")
+    
+    # Large input timing
+    try:
+        import numpy as np
+        size = 10_000_000
+        rng = np.random.default_rng(0)
+        arrays = (rng.integers(0, 4 * size, size), rng.integers(0, 4 * size, size))
+        list_a, list_b = arrays[0].tolist(), arrays[1].tolist()
+    except ImportError:
+        size = 1_000_000
+        rng = random.Random(0)
+        list_a = [rng.randrange(4 * size) for _ in range(size)]
+        list_b = [rng.randrange(4 * size) for _ in range(size)]
+        arrays = (None, None)
+    
+    print(f"\nTiming at {size:,} elements each")
+    print("-" * 100)
+    for label, (a, b) in [("lists", (list_a, list_b)), ("arrays", arrays)]:
+        if a is None:
+            continue
+        for mode in FIND_COMMON_MODES:
+            start = time.perf_counter()
+            result = find_common_auto(a, b, mode)
+            elapsed = time.perf_counter() - start
+            print(f"{label:6} | mode={mode:6} : {elapsed:.3f}s ({len(result):,} common)")
+
+
+def run_many_tests():
+    """Check find_common_many against chained two-list intersections."""
+    import random
+    import time
+    
+    print("\n" + "="*100)
+    print("N-WAY INTERSECTION TEST - find_common_many")
+    print("="*100)
+    
+    rng = random.Random(3)
+    test_cases = [
+        ([[1, 2, 3, 4], [3, 4, 5, 6], [4, 3, 7]], "Three lists"),
+        ([[1, 1, 2, 2, 3], [2, 2, 3, 3], [3, 2, 2]], "Duplicates"),
+        ([[1, 2, 3], [], [1, 2]], "Empty input"),
+        ([[1, 2, 3], [4, 5], [1, 2, 3]], "Early empty intersection"),
+        ([['a', 'b', 'c'], ['c', 'b'], ['b', 'c', 'd']], "String elements"),
+        ([[rng.randrange(5000) for _ in range(20000)] for _ in range(24)], "24 ID lists"),
+    ]
+    
+    for lists, description in test_cases:
+        failures = []
+        for mode, reference in [("filter", find_common_v5), ("unique", find_common_v6),
+                                ("sorted", find_common_v10)]:
+            expected = lists[0]
+            for other in lists[1:]:
+                expected = reference(expected, other)
+            for workers in (1, 2):
+                if find_common_many(*lists, mode=mode, workers=workers) != expected:
+                    failures.append(f"{mode}/workers={workers}")
+        status = "✓ All modes match" if not failures else f"✗ Mismatch: {', '.join(failures)}"
+        print(f"{description:25} : {status}")
+    
+    lists = test_cases[-1][0]
+    start = time.perf_counter()
+    expected = lists[0]
+    for other in lists[1:]:
+        expected = find_common_v6(expected, other)
+    chained = time.perf_counter() - start
+    start = time.perf_counter()
+    find_common_many(*lists)
+    many = time.perf_counter() - start
+    print(f"\nChained find_common_v6: {chained:.4f}s | find_common_many: {many:.4f}s")
+
+
+def run_stream_tests():
+    """Check the out-of-core intersection on iterables and files."""
+    import random
+    import time
+    
+    print("\n" + "="*100)
+    print("STREAMING INTERSECTION TEST - find_common_stream")
+    print("="*100)
+    
+    rng = random.Random(4)
+    list_a = [rng.randrange(400000) for _ in range(200000)]
+    list_b = [rng.randrange(400000) for _ in range(300000)]
+    expected = find_common_v10(list_a, list_b)
+    
+    # A tiny budget forces re-partitioning of every bucket
+    for max_memory in (256 * 1024 ** 2, 64 * 1024):
+        start = time.perf_counter()
+        result = sorted(find_common_stream(iter(list_a), iter(list_b), max_memory=max_memory))
+        elapsed = time.perf_counter() - start
+        status = "✓ MATCH" if result == expected else "✗ MISMATCH"
+        print(f"{status} | Iterables | max_memory={max_memory:>10,} | {elapsed:.3f}s")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name, values in (("a.txt", list_a), ("b.txt", list_b)):
+            path = os.path.join(tmp, name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(f"{value}\n" for value in values)
+            paths.append(path)
+        
+        start = time.perf_counter()
+        result = sorted(int(value) for value in find_common_stream(*paths, max_memory=1024 ** 2))
+        elapsed = time.perf_counter() - start
+        status = "✓ MATCH" if result == expected else "✗ MISMATCH"
+        print(f"{status} | Files     | max_memory={1024 ** 2:>10,} | {elapsed:.3f}s")
+
+
+def run_gallop_tests():
+    """Check the pre-sorted and galloping paths of find_common_v10."""
+    import random
+    import time
+    
+    print("\n" + "="*100)
+    print("SORTED INPUT / GALLOPING TEST - find_common_v10")
+    print("="*100)
+    
+    rng = random.Random(5)
+    large = list(range(0, 20_000_000, 2))
+    test_cases = [
+        (sorted(rng.sample(range(20_000_000), 100)), large, "100 vs 10M sorted"),
+        (large, sorted(rng.sample(range(20_000_000), 100)), "10M vs 100 sorted"),
+        ([1, 1, 2, 2, 3], [2, 2, 3, 3, 4], "Sorted with duplicates"),
+        ([5, 6, 7], list(range(1000)), "Small first list"),
+        ([], large, "Empty first list"),
+    ]
+    
+    for list_a, list_b, description in test_cases:
+        expected = sorted(set(list_a) & set(list_b))
+        start = time.perf_counter()
+        result = find_common_v10(list_a, list_b, assume_sorted=True)
+        elapsed = time.perf_counter() - start
+        status = "✓ MATCH" if result == expected else "✗ MISMATCH"
+        print(f"{status} | {description:25} | assume_sorted=True : {elapsed:.6f}s")
+    
+    start = time.perf_counter()
+    find_common_v10(test_cases[0][0], large)
+    elapsed = time.perf_counter() - start
+    print(f"{'':9} | {test_cases[0][2]:25} | assume_sorted=False: {elapsed:.6f}s")
+
+
+def run_bitmap_tests():
+    """Compare IntBitmap intersections with sets in speed and memory."""
+    import random
+    import sys
+    import time
+    
+    print("\n" + "="*100)
+    print("COMPACT INTEGER SET TEST - IntBitmap")
+    print("="*100)
+    
+    rng = random.Random(6)
+    for size in (1000, 1_000_000):
+        # Dense IDs: each list covers half of a contiguous ID range
+        list_a = rng.sample(range(2 * size), size)
+        list_b = rng.sample(range(2 * size), size)
+        expected = find_common_v10(list_a, list_b)
+        
+        start = time.perf_counter()
+        set_a, set_b = set(list_a), set(list_b)
+        set_common = set_a & set_b
+        set_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        bitmap_a, bitmap_b = IntBitmap(list_a), IntBitmap(list_b)
+        bitmap_common = bitmap_a & bitmap_b
+        bitmap_time = time.perf_counter() - start
+        
+        status = "✓ MATCH" if bitmap_common.tolist() == expected else "✗ MISMATCH"
+        count_ok = bitmap_a.intersection_count(bitmap_b) == len(set_common)
+        print(f"{status} | Size: {size:>9,} | Count: {'✓' if count_ok else '✗'} | "
+              f"set: {set_time:.4f}s {sys.getsizeof(set_a):>11,} B | "
+              f"IntBitmap: {bitmap_time:.4f}s {bitmap_a.nbytes:>9,} B")
+    
+    # Sparse IDs: almost every value gets a chunk of its own
+    list_a = [rng.randrange(1 << 40) for _ in range(20000)]
+    list_b = list_a[:10000] + [rng.randrange(1 << 40) for _ in range(10000)]
+    start = time.perf_counter()
+    bitmap_a, bitmap_b = IntBitmap(list_a), IntBitmap(list_b)
+    bitmap_common = bitmap_a & bitmap_b
+    bitmap_time = time.perf_counter() - start
+    status = "✓ MATCH" if bitmap_common.tolist() == find_common_v10(list_a, list_b) else "✗ MISMATCH"
+    print(f"{status} | Sparse 40-bit IDs: {len(list_a):,} | "
+          f"set: {sys.getsizeof(set(list_a)):>11,} B | "
+          f"IntBitmap: {bitmap_time:.4f}s {bitmap_a.nbytes:>9,} B")
+    
+    # Unsigned values beyond int64 are rejected rather than wrapped
+    try:
+        import numpy as np
+        try:
+            IntBitmap(np.array([2**63 + 5], dtype=np.uint64))
+            print("✗ MISMATCH | uint64 above 2**63 was accepted")
+        except OverflowError:
+            print("✓ MATCH | uint64 above 2**63 raises OverflowError")
+    except ImportError:
+        pass
+    
+    # auto falls back to hashing when the other side is not all integers
+    mixed_ok = (find_common_auto(IntBitmap([1, 2]), [2.0]) == [2]
+                and find_common_auto([2.0, "x", 3], IntBitmap([2, 3])) == [2.0, 3])
+    print(f"{'✓ MATCH' if mixed_ok else '✗ MISMATCH'} | IntBitmap vs floats and strings")
+
+
+def run_index_tests():
+    """Check CommonIndex lookups, persistence and memory-mapped reload."""
+    import random
+    import time
+    
+    print("\n" + "="*100)
+    print("PREBUILT INDEX TEST - CommonIndex")
+    print("="*100)
+    
+    rng = random.Random(7)
+    reference = [rng.randrange(4_000_000) for _ in range(2_000_000)]
+    queries = [[rng.randrange(4_000_000) for _ in range(100)] for _ in range(200)]
+    
+    reference_set = set(reference)
+    expected = [[[x for x in query if x in reference_set],
+                 list(dict.fromkeys(x for x in query if x in reference_set)),
+                 sorted(reference_set.intersection(query))]
+                for query in queries]
+    
+    kinds = ["hash"]
+    try:
+        import numpy  # noqa: F401
+        kinds.append("sorted")
+    except ImportError:
+        pass
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in kinds:
+            start = time.perf_counter()
+            index = CommonIndex(reference, kind=kind)
+            build_time = time.perf_counter() - start
+            
+            path = os.path.join(tmp, f"index_{kind}.bin")
+            index.save(path)
+            start = time.perf_counter()
+            loaded = CommonIndex.load(path)
+            load_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            results = [[loaded.common(query, mode) for mode in FIND_COMMON_MODES]
+                       for query in queries]
+            query_time = time.perf_counter() - start
+            all_match = results == expected
+            
+            status = "✓ MATCH" if all_match else "✗ MISMATCH"
+            print(f"{status} | kind={kind:6} | Build: {build_time:.3f}s | Load: {load_time:.4f}s | "
+                  f"{len(queries) * 3} queries: {query_time:.4f}s")
+            del loaded
+    
+    # Mixed references must not be rounded into a numeric index
+    mixed = CommonIndex(list(range(10)) + ["x", 2**53 + 1])
+    mixed_ok = (mixed.common(["5", 7, "x", 2**53]) == [7, "x"]
+                and CommonIndex([1, 2, 3]).common([2.0, 2.5, "3"]) == [2.0])
+    status = "✓ MATCH" if mixed_ok else "✗ MISMATCH"
+    print(f"{status} | Mixed-type reference and query")
+
+
+def run_bloom_tests():
+    """Check the Bloom-filter prefilter on low-overlap inputs."""
+    import random
+    import time
+    
+    print("\n" + "="*100)
+    print("BLOOM FILTER PREFILTER TEST")
+    print("="*100)
+    
+    rng = random.Random(8)
+    small = [rng.randrange(10 ** 9) for _ in range(20000)]
+    # Under 1% of the large input overlaps with the small one
+    large = [rng.randrange(10 ** 9) for _ in range(500000)] + small[:2000]
+    inputs = [("lists", large, small)]
+    try:
+        import numpy as np
+        inputs.append(("arrays", np.array(large), np.array(small)))
+    except ImportError:
+        pass
+    
+    for label, list_a, list_b in inputs:
+        for mode in FIND_COMMON_MODES:
+            start = time.perf_counter()
+            expected = find_common_auto(list_a, list_b, mode)
+            plain_time = time.perf_counter() - start
+            start = time.perf_counter()
+            result = find_common_auto(list_a, list_b, mode, prefilter=True)
+            bloom_time = time.perf_counter() - start
+            status = "✓ MATCH" if result == expected else "✗ MISMATCH"
+            print(f"{status} | {label:6} | mode={mode:6} | Plain: {plain_time:.4f}s | "
+                  f"Prefiltered: {bloom_time:.4f}s")
+    
+    # Equal numbers of different types must never be filtered out
+    cases = [
+        ([-1.0, 5.0, 3.0], [-1, 5, 7, 8], "Negative float vs int"),
+        ([-2, -1, 0, 1], [-1, -2, 9], "Negative ints"),
+        ([float(2**62), 2.5], [2**62, 7], "Floats above 2**61"),
+        ([-(2**63), 2**63 - 1], [-(2**63), 2**63 - 1], "int64 limits"),
+    ]
+    try:
+        import numpy as np
+        cases.append(([np.int64(-1), np.float64(4.0)], [-1, 4, 6], "NumPy scalars"))
+        cases.append((np.array([-1, -3, 2**62]), [-1.0, float(2**62)], "Array vs floats"))
+        cases.append(([-1.0, -3.0], np.array([-1, 5], dtype=np.int64), "Floats vs array"))
+    except ImportError:
+        pass
+    # Called directly, since find_common_auto skips the filter for arrays
+    for list_a, list_b, description in cases:
+        match = all(_bloom_prefilter(list_a, list_b, mode, True, "auto")
+                    == find_common_auto(list_a, list_b, mode)
+                    for mode in FIND_COMMON_MODES)
+        print(f"{'✓ MATCH' if match else '✗ MISMATCH'} | {description}")
+    
+    # Build once over the fixed side and reuse it for several probes
+    bloom = BloomFilter(len(small), error_rate=0.001, max_bytes=64 * 1024)
+    bloom.add_many(inputs[-1][2])
+    all_match = all(
+        _bloom_prefilter(probe, inputs[-1][2], "sorted", bloom, "auto")
+        == find_common_auto(probe, inputs[-1][2], "sorted")
+        for probe in (inputs[-1][1][:100000], inputs[-1][1][100000:])
+    )
+    print(f"{'✓ MATCH' if all_match else '✗ MISMATCH'} | Reused filter: {bloom.nbytes:,} B, "
+          f"{bloom.num_hashes} hashes, expected FPR {bloom.expected_error_rate:.4f}")
+
+
+def run_partition_tests():
+    """Check the partitioned intersection and print its scaling curve."""
+    import datetime
+    import random
+    
+    print("\n" + "="*100)
+    print("PARTITIONED PARALLEL INTERSECTION TEST")
+    print("="*100)
+    
+    rng = random.Random(9)
+    list_a = [rng.randrange(50000) for _ in range(40000)]
+    list_b = [rng.randrange(50000) for _ in range(30000)]
+    inputs = [("lists", list_a, list_b), ("strings", [str(x) for x in list_a], [str(x) for x in list_b])]
+    # Dates hash differently in every process, so they must not be sent to one
+    epoch = datetime.date(2000, 1, 1)
+    inputs.append(("dates", [epoch + datetime.timedelta(x) for x in list_a],
+                   [epoch + datetime.timedelta(x) for x in list_b]))
+    try:
+        import numpy as np
+        inputs.append(("arrays", np.array(list_a), np.array(list_b)))
+    except ImportError:
+        pass
+    
+    for label, a, b in inputs:
+        failures = []
+        for mode in FIND_COMMON_MODES:
+            expected = find_common_auto(a, b, mode, strategy="hash")
+            for executor in ("process", "thread"):
+                if find_common_partitioned(a, b, mode, workers=2, executor=executor) != expected:
+                    failures.append(f"{mode}/{executor}")
+        status = "✓ All modes match" if not failures else f"✗ Mismatch: {', '.join(failures)}"
+        print(f"{label:8} : {status}")
+    
+    print("\nScaling curve")
+    print("-" * 100)
+    # 100M elements need several GB, so the self-check stops at 10M
+    for row in benchmark_partitioned(sizes=PARTITION_BENCHMARK_SIZES[:2],
+                                     max_workers=max(2, os.cpu_count() or 1)):
+        print(f"Size: {row['size']:>11,} | Workers: {row['workers']:2} | "
+              f"{row['seconds']:.4f}s | Speedup: {row['speedup']:.2f}x")
+
+
+def run_live_tests():
+    """Replay random add/remove events and compare with find_common_v5."""
+    import random
+    import time
+    from collections import Counter
+    
+    print("\n" + "="*100)
+    print("INCREMENTAL INTERSECTION TEST - LiveIntersection")
+    print("="*100)
+    
+    rng = random.Random(10)
+    live = LiveIntersection()
+    sides = {"a": [], "b": []}
+    mismatches = 0
+    update_time = 0.0
+    
+    for step in range(20000):
+        side = rng.choice("ab")
+        values = sides[side]
+        if values and rng.random() < 0.4:
+            element = values.pop(rng.randrange(len(values)))
+            event = (side, "remove", element)
+        else:
+            element = rng.randrange(300)
+            values.append(element)
+            event = (side, "add", element)
+        
+        start = time.perf_counter()
+        live.apply([event])
+        update_time += time.perf_counter() - start
+        
+        if step % 500 == 0:
+            expected = Counter(find_common_v5(sides["a"], sides["b"]))
+            if Counter(live.to_list()) != expected:
+                mismatches += 1
+    
+    status = "✓ MATCH" if not mismatches else f"✗ {mismatches} MISMATCHES"
+    print(f"{status} | 20,000 events | {update_time / 20000 * 1e6:.2f} µs per update | "
+          f"{len(live)} distinct common elements")
+
+
+def run_ndarray_tests():
+    """Check find_common_v11 on arrays, buffers and memory-mapped files."""
+    import time
+    from array import array
+    
+    print("\n" + "="*100)
+    print("NUMPY-NATIVE TEST - find_common_v11")
+    print("="*100)
+    
+    try:
+        import numpy as np
+    except ImportError:
+        print("NumPy not available, skipped")
+        return
+    
+    rng = np.random.default_rng(11)
+    a = rng.integers(0, 4_000_000, 2_000_000)
+    b = rng.integers(0, 4_000_000, 2_000_000)
+    expected = find_common_auto(a, b, "sorted")
+    
+    unique_a, unique_b = _sorted_unique(np, a), _sorted_unique(np, b)
+    rng.shuffle(unique_a)
+    buffer_a = array("q", a.tolist())
+    cases = [
+        ("ndarray", lambda: find_common_v11(a, b)),
+        ("assume_unique", lambda: find_common_v11(unique_a, unique_b, assume_unique=True)),
+        ("array.array", lambda: find_common_v11(buffer_a, b)),
+        ("bytes + dtype", lambda: find_common_v11(a.tobytes(), b.tobytes(), dtype=a.dtype)),
+    ]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name, values in (("a.bin", a), ("b.bin", b)):
+            path = os.path.join(tmp, name)
+            values.tofile(path)
+            paths.append(path)
+        cases.append(("np.memmap", lambda: find_common_v11(
+            np.memmap(paths[0], dtype=a.dtype, mode="r"),
+            np.memmap(paths[1], dtype=b.dtype, mode="r"))))
+        
+        for label, run in cases:
+            start = time.perf_counter()
+            result = run()
+            elapsed = time.perf_counter() - start
+            match = isinstance(result, np.ndarray) and result.tolist() == expected
+            status = "✓ MATCH" if match else "✗ MISMATCH"
+            print(f"{status} | {label:14} | {elapsed:.4f}s | {len(result):,} common")
+
+
+if __name__ == "__main__":
+    # Run comprehensive tests
+    run_comparison_tests()
+    
+    # Run performance tests
+    run_performance_tests()
+    
+    # Run find_common_auto engine tests
+    run_engine_tests()
+    
+    # Run N-way intersection tests
+    run_many_tests()
+    
+    # Run streaming intersection tests
+    run_stream_tests()
+    
+    # Run sorted input / galloping tests
+    run_gallop_tests()
+    
+    # Run compact integer set tests
+    run_bitmap_tests()
+    
+    # Run prebuilt index tests
+    run_index_tests()
+    
+    # Run Bloom filter prefilter tests
+    run_bloom_tests()
+    
+    # Run partitioned parallel intersection tests
+    run_partition_tests()
+    
+    # Run incremental intersection tests
+    run_live_tests()
+    
+    # Run NumPy-native intersection tests
+    run_ndarray_tests()
\ No newline at end of file
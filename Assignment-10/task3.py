@@ -1,3 +1,19 @@
+import asyncio
+import csv
+import io
+import json
+import mmap
+import numbers
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager, nullcontext
+from heapq import merge
+
+
 class emp:
     """
     A class to represent an employee with salary management capabilities.
@@ -240,6 +256,1289 @@ class emp_v10:
         print(f"emp: {self.n} salary: {self.s}")
 
 
+# Largest int magnitude a double column stores exactly
+MAX_EXACT_SALARY = 2**53
+
+
+def _check_salary(s) -> None:
+    """Reject int salaries that would be rounded by the float column."""
+    if type(s) is int and abs(s) > MAX_EXACT_SALARY:
+        raise ValueError(f"int salaries must be within ±{MAX_EXACT_SALARY} to be stored exactly")
+
+
+class EmployeeTable:
+    """
+    A columnar store of employees for large collections.
+    
+    Names are kept in one list and salaries in one ``array('d')`` column,
+    instead of one object with its own ``__dict__`` per employee. Rows are
+    exposed through lightweight `EmployeeRow` views that behave like `emp`.
+    
+    Attributes
+    ----------
+    names : list of str
+        The name column.
+    salaries : array.array
+        The salary column as doubles.
+    
+    Methods
+    -------
+    append(n, s):
+        Add an employee and return its row index.
+    inc(i, p):
+        Increase the salary of row i by a given percentage.
+    pr(i):
+        Print the details of row i.
+    
+    Examples
+    --------
+    >>> table = EmployeeTable([("Alice", 50000), ("Bob", 60000)])
+    >>> table[0].inc(10)
+    >>> table[0].pr()
+    emp: Alice salary: 55000.00000000001
+    """
+    
+    def __init__(self, rows=()):
+        """
+        Initialize an EmployeeTable object.
+        
+        Parameters
+        ----------
+        rows : iterable of tuple, optional
+            Initial ``(name, salary)`` pairs.
+        """
+        self.names = []
+        self.salaries = array("d")
+        # 1 while a salary still holds the int it was created with, so it
+        # reads back (and prints) exactly like emp.s; append and set_salary
+        # only accept ints that a double holds exactly
+        self._int_flags = bytearray()
+        # Objects notified of appends and salary changes, e.g. EmployeeIndex
+        self._listeners = []
+        # Serializes notifications; ConcurrentEmployeeTable installs a real lock
+        self._listener_lock = nullcontext()
+        self.extend(rows)
+    
+    @classmethod
+    def from_emps(cls, employees) -> "EmployeeTable":
+        """
+        Build a table from emp (or emp_v*) objects.
+        
+        Parameters
+        ----------
+        employees : iterable
+            Objects with ``n`` and ``s`` attributes.
+        
+        Returns
+        -------
+        EmployeeTable
+            A table holding the same names and salaries.
+        """
+        return cls((employee.n, employee.s) for employee in employees)
+    
+    def append(self, n: str, s: float) -> int:
+        """
+        Add an employee.
+        
+        Parameters
+        ----------
+        n : str
+            The name of the employee.
+        s : float
+            The initial salary of the employee.
+        
+        Returns
+        -------
+        int
+            The row index of the new employee.
+        
+        Raises
+        ------
+        ValueError
+            If s is an int beyond MAX_EXACT_SALARY, which the float
+            column could not store exactly.
+        """
+        _check_salary(s)
+        self.names.append(n)
+        self.salaries.append(s)
+        self._int_flags.append(type(s) is int)
+        i = len(self.names) - 1
+        if self._listeners:
+            with self._listener_lock:
+                for listener in self._listeners:
+                    listener.row_added(i)
+        return i
+    
+    def extend(self, rows) -> None:
+        """Add several ``(name, salary)`` pairs."""
+        for n, s in rows:
+            self.append(n, s)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def _row(self, i: int) -> int:
+        """Return i as a non-negative row number, or raise IndexError."""
+        if i < 0:
+            i += len(self.names)
+        if not 0 <= i < len(self.names):
+            raise IndexError("EmployeeTable index out of range")
+        return i
+    
+    def __getitem__(self, i: int) -> "EmployeeRow":
+        return EmployeeRow(self, self._row(i))
+    
+    def __iter__(self):
+        for i in range(len(self.names)):
+            yield EmployeeRow(self, i)
+    
+    def salary(self, i: int) -> float:
+        """Return the salary of row i as emp.s would hold it."""
+        i = self._row(i)
+        s = self.salaries[i]
+        return int(s) if self._int_flags[i] else s
+    
+    def set_salary(self, i: int, s: float) -> None:
+        """Replace the salary of row i (ints as for append)."""
+        i = self._row(i)
+        _check_salary(s)
+        old = self.salaries[i]
+        self.salaries[i] = s
+        self._int_flags[i] = type(s) is int
+        self._salaries_changed([i], [old], [self.salaries[i]])
+    
+    def inc(self, i: int, p: float) -> None:
+        """
+        Increase the salary of row i by a given percentage.
+        
+        Parameters
+        ----------
+        i : int
+            The row index.
+        p : float
+            The percentage to increase the salary by.
+        """
+        # Listeners must see the row number, not a negative index
+        i = self._row(i)
+        # Same formula as emp.inc so results are bit-identical
+        old = self.salaries[i]
+        self.salaries[i] = old * (1 + p / 100)
+        self._int_flags[i] = 0
+        self._salaries_changed([i], [old], [self.salaries[i]])
+    
+    def add_listener(self, listener) -> None:
+        """
+        Register an object to be told about appends and salary changes.
+        
+        Parameters
+        ----------
+        listener : object
+            Provides ``row_added(i)`` and ``salaries_changed(rows, old, new)``.
+        """
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener) -> None:
+        """Stop notifying a listener registered with add_listener."""
+        self._listeners.remove(listener)
+    
+    def _salaries_changed(self, rows: list, old: list, new: list) -> None:
+        """Tell every listener which rows changed salary."""
+        if self._listeners:
+            with self._listener_lock:
+                for listener in self._listeners:
+                    listener.salaries_changed(rows, old, new)
+    
+    def pr(self, i: int) -> None:
+        """Print the details of row i in the emp.pr format."""
+        print(f"emp: {self.names[i]} salary: {self.salary(i)}")
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns, name strings included."""
+        return (sys.getsizeof(self.names) + sum(sys.getsizeof(n) for n in self.names)
+                + sys.getsizeof(self.salaries) + sys.getsizeof(self._int_flags))
+
+
+class EmployeeRow:
+    """
+    A view of one EmployeeTable row with the emp interface.
+    
+    Attributes
+    ----------
+    n : str
+        The name of the employee.
+    s : float
+        The current salary of the employee.
+    """
+    
+    __slots__ = ("_table", "_index")
+    
+    def __init__(self, table: EmployeeTable, index: int):
+        self._table = table
+        self._index = index
+    
+    @property
+    def n(self) -> str:
+        return self._table.names[self._index]
+    
+    @property
+    def s(self) -> float:
+        return self._table.salary(self._index)
+    
+    @s.setter
+    def s(self, value: float) -> None:
+        self._table.set_salary(self._index, value)
+    
+    def inc(self, p: float) -> None:
+        """Increase the salary by a given percentage."""
+        self._table.inc(self._index, p)
+    
+    def pr(self) -> None:
+        """Display the employee details."""
+        self._table.pr(self._index)
+    
+    def __repr__(self) -> str:
+        return f"EmployeeRow(n={self.n!r}, s={self.s!r})"
+
+
+def apply_increase(table: EmployeeTable, pct, mask=None) -> None:
+    """
+    Increase salaries across a whole EmployeeTable in one operation.
+    
+    Each selected salary becomes ``s * (1 + p / 100)``, the same formula as
+    `emp.inc`, so results are bit-identical to calling inc row by row. With
+    NumPy the salary column is updated in place through a zero-copy view.
+    
+    Parameters
+    ----------
+    table : EmployeeTable
+        The table to update.
+    pct : float or sequence of float
+        One percentage for every row, or one percentage per row.
+    mask : sequence of bool, optional
+        Only rows where the mask is true are raised.
+    
+    Returns
+    -------
+    None
+    
+    Examples
+    --------
+    >>> table = EmployeeTable([("Alice", 50000), ("Bob", 60000)])
+    >>> apply_increase(table, 10, mask=[True, False])
+    >>> table.salary(0), table.salary(1)
+    (55000.00000000001, 60000)
+    """
+    size = len(table)
+    # numbers.Real also covers NumPy scalars such as np.int64
+    is_scalar = isinstance(pct, numbers.Real)
+    if not is_scalar and len(pct) != size:
+        raise ValueError("pct must be a number or have one entry per row")
+    if mask is not None and len(mask) != size:
+        raise ValueError("mask must have one entry per row")
+    
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    
+    if np is None:
+        for i in range(size):
+            if mask is None or mask[i]:
+                table.inc(i, pct if is_scalar else pct[i])
+        return
+    
+    if size == 0:
+        return
+    salaries = np.frombuffer(table.salaries, dtype=np.float64)
+    int_flags = np.frombuffer(table._int_flags, dtype=np.uint8)
+    factors = 1 + np.asarray(pct, dtype=np.float64) / 100
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+    
+    # Remember the old values only when someone needs to hear about them
+    if table._listeners:
+        rows = np.arange(size) if mask is None else np.flatnonzero(mask)
+        old = salaries[rows]
+    
+    if mask is None:
+        salaries *= factors
+        int_flags[:] = 0
+    else:
+        if factors.ndim:
+            factors = factors[mask]
+        salaries[mask] *= factors
+        int_flags[mask] = 0
+    
+    if table._listeners:
+        table._salaries_changed(rows.tolist(), old.tolist(), salaries[rows].tolist())
+
+
+def apply_increases(table: EmployeeTable, raises) -> None:
+    """
+    Apply several raises in order, compounding them.
+    
+    Parameters
+    ----------
+    table : EmployeeTable
+        The table to update.
+    raises : iterable of tuple
+        ``(pct, mask)`` pairs passed to `apply_increase` one after the
+        other; mask may be None.
+    
+    Returns
+    -------
+    None
+    """
+    for pct, mask in raises:
+        apply_increase(table, pct, mask)
+
+
+class EmployeeIndex:
+    """
+    Hash and sorted-salary indexes over an EmployeeTable.
+    
+    The index registers itself as a listener on the table, so appends,
+    `inc` calls on rows and bulk raises from `apply_increase` update it
+    incrementally instead of rebuilding it.
+    
+    Methods
+    -------
+    find(n):
+        Return the rows of every employee with a given name.
+    salary_range(low, high):
+        Return the rows with low <= salary <= high, lowest first.
+    top_k(k):
+        Return the k highest paid rows, highest first.
+    close():
+        Stop following changes to the table.
+    
+    Examples
+    --------
+    >>> table = EmployeeTable([("Alice", 50000), ("Bob", 60000)])
+    >>> index = EmployeeIndex(table)
+    >>> table[0].inc(30)
+    >>> [row.n for row in index.top_k(1)]
+    ['Alice']
+    """
+    
+    # Above this share of changed rows, bulk changes are merged in one pass
+    MERGE_FRACTION = 1 / 64
+    
+    def __init__(self, table: EmployeeTable):
+        """
+        Build the indexes and start following the table.
+        
+        Parameters
+        ----------
+        table : EmployeeTable
+            The table to index.
+        """
+        self._table = table
+        self._by_name = {}
+        for i, n in enumerate(table.names):
+            self._by_name.setdefault(n, []).append(i)
+        # Sorted (salary, row) pairs
+        self._by_salary = sorted(zip(table.salaries, range(len(table))))
+        table.add_listener(self)
+    
+    def close(self) -> None:
+        """Stop following changes to the table."""
+        self._table.remove_listener(self)
+    
+    def row_added(self, i: int) -> None:
+        """Index a newly appended row."""
+        self._by_name.setdefault(self._table.names[i], []).append(i)
+        insort(self._by_salary, (self._table.salaries[i], i))
+    
+    def salaries_changed(self, rows: list, old: list, new: list) -> None:
+        """Move changed rows to their new place in the salary index."""
+        by_salary = self._by_salary
+        if len(rows) <= len(by_salary) * self.MERGE_FRACTION:
+            for i, old_salary, new_salary in zip(rows, old, new):
+                del by_salary[bisect_left(by_salary, (old_salary, i))]
+                insort(by_salary, (new_salary, i))
+            return
+        
+        # Many rows changed: drop them and merge their new entries back in
+        changed = set(rows)
+        kept = [entry for entry in by_salary if entry[1] not in changed]
+        self._by_salary = list(merge(kept, sorted(zip(new, rows))))
+    
+    def find(self, n: str) -> list:
+        """
+        Return the rows of every employee with a given name.
+        
+        Parameters
+        ----------
+        n : str
+            The name to look up.
+        
+        Returns
+        -------
+        list of EmployeeRow
+            The matching rows, in table order.
+        """
+        return [self._table[i] for i in self._by_name.get(n, ())]
+    
+    def salary_range(self, low: float, high: float) -> list:
+        """
+        Return the rows whose salary lies in a closed range.
+        
+        Parameters
+        ----------
+        low : float
+            The lowest salary to include.
+        high : float
+            The highest salary to include.
+        
+        Returns
+        -------
+        list of EmployeeRow
+            The matching rows, lowest salary first.
+        """
+        start = bisect_left(self._by_salary, (low, -1))
+        end = bisect_right(self._by_salary, (high, len(self._table)))
+        return [self._table[i] for _, i in self._by_salary[start:end]]
+    
+    def top_k(self, k: int) -> list:
+        """
+        Return the highest paid rows.
+        
+        Parameters
+        ----------
+        k : int
+            The number of rows to return.
+        
+        Returns
+        -------
+        list of EmployeeRow
+            Up to k rows, highest salary first.
+        """
+        if k <= 0:
+            return []
+        return [self._table[i] for _, i in reversed(self._by_salary[-k:])]
+
+
+# Default number of lock stripes used by ConcurrentEmployeeTable
+LOCK_STRIPES = 64
+
+
+class ConcurrentEmployeeTable:
+    """
+    Thread-safe wrapper around an EmployeeTable using striped locks.
+    
+    Row i is guarded by lock ``i % stripes``, so raises to unrelated
+    employees usually take different locks and do not wait on each other.
+    Operations touching several rows take their stripes in ascending
+    order, which keeps them atomic and free of lock-order deadlocks.
+    Listeners such as EmployeeIndex are notified under one extra lock,
+    taken after the stripes, so concurrent raises on different stripes
+    never update an index at the same time.
+    
+    Methods
+    -------
+    salary(i):
+        Return the salary of row i.
+    inc(i, p):
+        Increase the salary of row i by p percent.
+    apply_raises(raises):
+        Apply (row, pct) raises as one atomic batch.
+    apply_increase(pct, mask=None):
+        Atomically raise every selected row, as apply_increase does.
+    append(n, s):
+        Add a new employee and return its row number.
+    
+    Examples
+    --------
+    >>> table = ConcurrentEmployeeTable(EmployeeTable([("Alice", 50000), ("Bob", 60000)]))
+    >>> table.apply_raises([(0, 10), (1, 5)])
+    >>> table.salary(1)
+    63000.0
+    """
+    
+    def __init__(self, table: EmployeeTable, stripes: int = LOCK_STRIPES):
+        """
+        Wrap a table with a fixed set of stripe locks.
+        
+        Parameters
+        ----------
+        table : EmployeeTable
+            The table to guard. It should not be changed directly
+            while the wrapper is in use.
+        stripes : int, optional
+            The number of locks rows are spread over.
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self.table = table
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        # Listeners see one change at a time, whichever stripe made it
+        table._listener_lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.table)
+    
+    @contextmanager
+    def _locked(self, stripe_ids):
+        """Hold the given stripes, always taken in ascending order."""
+        held = []
+        try:
+            for stripe in sorted(stripe_ids):
+                self._locks[stripe].acquire()
+                held.append(stripe)
+            yield
+        finally:
+            for stripe in reversed(held):
+                self._locks[stripe].release()
+    
+    def _all_stripes(self):
+        """Hold every stripe, for operations on the whole table."""
+        return self._locked(range(len(self._locks)))
+    
+    def _stripe(self, i: int) -> tuple:
+        """Return (row, lock) for index i, so -1 and its row share a stripe."""
+        i = self.table._row(i)
+        return i, self._locks[i % len(self._locks)]
+    
+    def salary(self, i: int):
+        """Return the salary of row i."""
+        i, lock = self._stripe(i)
+        with lock:
+            return self.table.salary(i)
+    
+    def set_salary(self, i: int, s) -> None:
+        """Replace the salary of row i."""
+        i, lock = self._stripe(i)
+        with lock:
+            self.table.set_salary(i, s)
+    
+    def inc(self, i: int, p: float) -> None:
+        """Increase the salary of row i by p percent."""
+        i, lock = self._stripe(i)
+        with lock:
+            self.table.inc(i, p)
+    
+    def apply_raises(self, raises) -> None:
+        """
+        Apply several per-row raises as one atomic batch.
+        
+        No other thread sees the batch half applied: every stripe the
+        batch touches is held until all raises are done.
+        
+        Parameters
+        ----------
+        raises : iterable of (int, float)
+            (row, pct) pairs, applied in order. A row may appear twice.
+        """
+        # Normalized up front, so a bad index fails before any raise is applied
+        raises = [(self.table._row(i), pct) for i, pct in raises]
+        stripes = len(self._locks)
+        with self._locked({i % stripes for i, _ in raises}):
+            for i, pct in raises:
+                self.table.inc(i, pct)
+    
+    def apply_increase(self, pct, mask=None) -> None:
+        """
+        Atomically raise every selected row by pct percent.
+        
+        Parameters
+        ----------
+        pct : float or sequence of float
+            The raise, as for apply_increase.
+        mask : sequence of bool, optional
+            Which rows to raise; all rows when omitted.
+        """
+        with self._all_stripes():
+            apply_increase(self.table, pct, mask)
+    
+    def append(self, n: str, s) -> int:
+        """
+        Add a new employee and return its row number.
+        
+        Appending may move the salary buffer, so it waits for every
+        stripe rather than racing with raises in progress.
+        """
+        with self._all_stripes():
+            return self.table.append(n, s)
+
+
+# Output formats supported by EmployeeReportWriter
+REPORT_FORMATS = ("text", "csv", "jsonl")
+
+
+def _employee_rows(employees):
+    """Yield (name, salary) pairs from an EmployeeTable or emp objects."""
+    if isinstance(employees, EmployeeTable):
+        # Read the columns directly instead of creating row views
+        for n, s, is_int in zip(employees.names, employees.salaries, employees._int_flags):
+            yield n, int(s) if is_int else s
+    else:
+        for employee in employees:
+            yield employee.n, employee.s
+
+
+class EmployeeReportWriter:
+    """
+    A buffered writer for employee reports.
+    
+    Rows are formatted into an in-memory buffer and written to the target
+    stream in large blocks, instead of one ``print`` call per employee.
+    The 'text' format is byte-identical to `emp.pr` output.
+    
+    Attributes
+    ----------
+    fmt : str
+        One of REPORT_FORMATS.
+    rows : int
+        Number of rows written so far.
+    
+    Methods
+    -------
+    write(n, s):
+        Add one employee row.
+    write_all(employees):
+        Add every row of an EmployeeTable or iterable of emp objects.
+    flush():
+        Write buffered rows to the stream.
+    close():
+        Flush, and close the stream if this writer opened it.
+    
+    Examples
+    --------
+    >>> with EmployeeReportWriter(sys.stdout) as writer:
+    ...     writer.write_all([emp("Alice", 50000)])
+    emp: Alice salary: 50000
+    """
+    
+    def __init__(self, target=None, fmt: str = "text", buffer_size: int = 1 << 16):
+        """
+        Initialize an EmployeeReportWriter object.
+        
+        Parameters
+        ----------
+        target : str or file-like, optional
+            A path to open for writing, or an open text stream.
+            Defaults to sys.stdout.
+        fmt : str
+            'text' (emp.pr lines), 'csv' or 'jsonl'.
+        buffer_size : int
+            Number of buffered characters that triggers a flush.
+        """
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format '{fmt}', expected one of {REPORT_FORMATS}")
+        self._owns_stream = isinstance(target, (str, os.PathLike))
+        if self._owns_stream:
+            self._stream = open(target, "w", newline="", encoding="utf-8")
+        else:
+            self._stream = target if target is not None else sys.stdout
+        self.fmt = fmt
+        self.rows = 0
+        self._buffer_size = buffer_size
+        self._buffer = io.StringIO()
+        self._csv = csv.writer(self._buffer, lineterminator="\n") if fmt == "csv" else None
+        if self._csv is not None:
+            self._csv.writerow(("name", "salary"))
+    
+    def write(self, n: str, s: float) -> None:
+        """Add one employee row to the buffer."""
+        if self.fmt == "text":
+            self._buffer.write(f"emp: {n} salary: {s}\n")
+        elif self.fmt == "csv":
+            self._csv.writerow((n, s))
+        else:
+            self._buffer.write(json.dumps({"name": n, "salary": s}) + "\n")
+        self.rows += 1
+        if self._buffer.tell() >= self._buffer_size:
+            self.flush()
+    
+    def write_all(self, employees) -> None:
+        """
+        Add every employee of a collection.
+        
+        Parameters
+        ----------
+        employees : EmployeeTable or iterable
+            A table, or objects with ``n`` and ``s`` attributes.
+        """
+        if self.fmt != "text":
+            for n, s in _employee_rows(employees):
+                self.write(n, s)
+            return
+        
+        # Format text rows in batches with a single join per batch
+        batch = []
+        for n, s in _employee_rows(employees):
+            batch.append(f"emp: {n} salary: {s}\n")
+            if len(batch) == 4096:
+                self._write_batch(batch)
+                batch = []
+        self._write_batch(batch)
+    
+    def _write_batch(self, lines: list) -> None:
+        """Append pre-formatted lines to the buffer."""
+        self._buffer.write("".join(lines))
+        self.rows += len(lines)
+        if self._buffer.tell() >= self._buffer_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write the buffered rows to the stream."""
+        data = self._buffer.getvalue()
+        if data:
+            self._stream.write(data)
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        self._stream.flush()
+    
+    def close(self) -> None:
+        """Flush, and close the stream if it was opened from a path."""
+        self.flush()
+        if self._owns_stream:
+            self._stream.close()
+    
+    def __enter__(self) -> "EmployeeReportWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_report(employees, target=None, fmt: str = "text") -> int:
+    """
+    Write a whole employee report with a buffered writer.
+    
+    Parameters
+    ----------
+    employees : EmployeeTable or iterable
+        A table, or objects with ``n`` and ``s`` attributes.
+    target : str or file-like, optional
+        A path or an open text stream. Defaults to sys.stdout.
+    fmt : str
+        One of REPORT_FORMATS.
+    
+    Returns
+    -------
+    int
+        Number of rows written.
+    """
+    with EmployeeReportWriter(target, fmt) as writer:
+        writer.write_all(employees)
+    return writer.rows
+
+
+# Async pipeline queue bound, in batches, and records per batch
+PIPELINE_QUEUE_SIZE = 8
+PIPELINE_BATCH_SIZE = 512
+
+
+def _parse_salary(s):
+    """Read a salary back as int when it was written as one."""
+    if isinstance(s, str):
+        return int(s) if s.lstrip("-").isdigit() else float(s)
+    return s
+
+
+def iter_employee_chunks(path: str, chunk_size: int = PIPELINE_BATCH_SIZE, fmt: str = None):
+    """
+    Read (name, salary) records from a CSV or JSON Lines report in chunks.
+    
+    Parameters
+    ----------
+    path : str
+        A file written by `write_report` in 'csv' or 'jsonl' format.
+    chunk_size : int
+        The maximum number of records per chunk.
+    fmt : str, optional
+        'csv' or 'jsonl'. Detected from the file suffix if omitted.
+    
+    Yields
+    ------
+    list of tuple
+        The next chunk of (name, salary) records.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if fmt is None:
+        fmt = "jsonl" if str(path).endswith((".jsonl", ".json")) else "csv"
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Unknown input format '{fmt}', expected 'csv' or 'jsonl'")
+    
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            reader = csv.reader(f)
+            next(reader, None)  # Skip the name,salary header
+            records = ((n, _parse_salary(s)) for n, s in reader)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+            records = ((row["name"], row["salary"]) for row in rows)
+        
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+class FakeEmployeeSource:
+    """
+    A local async source of employee records for tests and demos.
+    
+    Records are yielded one at a time, sleeping `delay` seconds before
+    each to imitate a slow remote feed.
+    
+    Attributes
+    ----------
+    produced : int
+        Number of records handed out so far.
+    
+    Examples
+    --------
+    >>> async def collect():
+    ...     return [record async for record in FakeEmployeeSource([("Alice", 50000)])]
+    >>> asyncio.run(collect())
+    [('Alice', 50000)]
+    """
+    
+    def __init__(self, records, delay: float = 0.0):
+        """
+        Initialize a FakeEmployeeSource object.
+        
+        Parameters
+        ----------
+        records : iterable of (str, float)
+            The (name, salary) records to produce.
+        delay : float
+            Seconds to wait before each record.
+        """
+        self.records = records
+        self.delay = delay
+        self.produced = 0
+    
+    async def __aiter__(self):
+        for record in self.records:
+            # Always yield to the event loop so several sources interleave
+            await asyncio.sleep(self.delay)
+            self.produced += 1
+            yield record
+
+
+async def _aiter_employee_chunks(source, batch_size: int):
+    """Yield lists of (name, salary) records from any supported source."""
+    if isinstance(source, (str, os.PathLike)):
+        # Read files in a worker thread so slow disks don't stall the loop
+        chunks = iter_employee_chunks(source, batch_size)
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
+        return
+    
+    chunk = []
+    if hasattr(source, "__aiter__"):
+        async for record in source:
+            chunk.append(record)
+            if len(chunk) == batch_size:
+                yield chunk
+                chunk = []
+    else:
+        for record in source:
+            chunk.append(record)
+            if len(chunk) == batch_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _run_all(coros) -> None:
+    """Run coroutines together; if one fails, cancel the rest and re-raise."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def run_employee_pipeline(sources, raises=(), target=None, fmt: str = "text",
+                                queue_size: int = PIPELINE_QUEUE_SIZE,
+                                batch_size: int = PIPELINE_BATCH_SIZE,
+                                keep_table: bool = True) -> EmployeeTable:
+    """
+    Ingest employees from several sources, apply raises and stream a report.
+    
+    Every source is read concurrently into one bounded queue. A builder
+    appends the records to an EmployeeTable and applies the raises, then
+    hands the rows to a reporter through a second bounded queue. When the
+    report target is slow both queues fill up and the sources are paused,
+    so at most about ``2 * queue_size`` batches are in flight. The returned
+    table still grows with the input; pass keep_table=False to report
+    each batch from its own short-lived table and keep memory bounded.
+    
+    Parameters
+    ----------
+    sources : iterable
+        Each source is an async iterable or iterable of (name, salary)
+        records, or a path to a CSV/JSON Lines file from `write_report`.
+    raises : iterable of (float, callable or None)
+        (pct, select) pairs applied in order to every new row. `select`
+        is called with the name and current salary; None selects everyone.
+    target : str or file-like, optional
+        Where the report goes, as for EmployeeReportWriter.
+    fmt : str
+        One of REPORT_FORMATS.
+    queue_size : int
+        The maximum number of batches waiting in each queue.
+    batch_size : int
+        The maximum number of records per batch.
+    keep_table : bool
+        Collect every employee into the returned table.
+    
+    Returns
+    -------
+    EmployeeTable or None
+        Every ingested employee with raises applied, or None when
+        keep_table is False.
+    """
+    if queue_size < 1 or batch_size < 1:
+        raise ValueError("queue_size and batch_size must be at least 1")
+    sources = list(sources)
+    raises = list(raises)
+    table = EmployeeTable()
+    records = asyncio.Queue(queue_size)
+    ready = asyncio.Queue(queue_size)
+    # Flushes are done explicitly, in a worker thread, once per batch
+    writer = EmployeeReportWriter(target, fmt, buffer_size=sys.maxsize)
+    
+    async def ingest(source):
+        async for chunk in _aiter_employee_chunks(source, batch_size):
+            await records.put(chunk)
+    
+    async def ingest_all():
+        await _run_all(ingest(source) for source in sources)
+        await records.put(None)
+    
+    async def build():
+        while (chunk := await records.get()) is not None:
+            batch = table if keep_table else EmployeeTable()
+            start = len(batch)
+            for n, s in chunk:
+                i = batch.append(n, s)
+                for pct, select in raises:
+                    if select is None or select(n, batch.salary(i)):
+                        batch.inc(i, pct)
+            await ready.put((batch, range(start, len(batch))))
+        await ready.put(None)
+    
+    async def report():
+        while (item := await ready.get()) is not None:
+            batch, rows = item
+            for i in rows:
+                writer.write(batch.names[i], batch.salary(i))
+            await asyncio.to_thread(writer.flush)
+    
+    try:
+        await _run_all([ingest_all(), build(), report()])
+    finally:
+        writer.close()
+    return table if keep_table else None
+
+
+# Binary employee store layout: magic, row count, name blob size
+STORE_MAGIC = b"EMPTBL1\0"
+_STORE_HEADER = struct.Struct("<8sQQ")
+
+
+def _store_offsets(count: int) -> tuple:
+    """Return the byte offsets of the salary, name offset, flag and name sections."""
+    salaries = _STORE_HEADER.size
+    name_offsets = salaries + 8 * count
+    flags = name_offsets + 8 * (count + 1)
+    names = flags + count
+    return salaries, name_offsets, flags, names
+
+
+class _NameColumn:
+    """A read-only name column decoded on demand from an offset-indexed blob."""
+    
+    __slots__ = ("_blob", "_offsets")
+    
+    def __init__(self, blob: memoryview, offsets):
+        self._blob = blob
+        self._offsets = offsets
+    
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+    
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        return bytes(self._blob[self._offsets[i]:self._offsets[i + 1]]).decode("utf-8")
+    
+    def __iter__(self):
+        blob, offsets = self._blob, self._offsets
+        for i in range(len(offsets) - 1):
+            yield bytes(blob[offsets[i]:offsets[i + 1]]).decode("utf-8")
+    
+    def append(self, n: str) -> None:
+        # Called first by EmployeeTable.append, so no column is changed
+        raise TypeError("tables loaded from a store cannot grow")
+
+
+def save_table(table: EmployeeTable, path: str) -> None:
+    """
+    Save an EmployeeTable in a compact binary layout.
+    
+    The file holds a header, the salaries as little-endian float64, the
+    name end offsets as uint64, the int flags, and the UTF-8 name blob, so
+    `load_table` can map every column without parsing.
+    
+    Parameters
+    ----------
+    table : EmployeeTable
+        The table to save.
+    path : str
+        The destination file.
+    """
+    encoded = [n.encode("utf-8") for n in table.names]
+    offsets = array("Q", [0])
+    for name in encoded:
+        offsets.append(offsets[-1] + len(name))
+    salaries = array("d", table.salaries)
+    if sys.byteorder != "little":
+        salaries.byteswap()
+        offsets.byteswap()
+    
+    with open(path, "wb") as f:
+        f.write(_STORE_HEADER.pack(STORE_MAGIC, len(encoded), offsets[-1]))
+        f.write(salaries.tobytes())
+        f.write(offsets.tobytes())
+        f.write(bytes(table._int_flags))
+        f.write(b"".join(encoded))
+
+
+def load_table(path: str, writable: bool = False) -> EmployeeTable:
+    """
+    Load a table saved by `save_table` by memory-mapping the file.
+    
+    No rows are parsed: the salary column is a ``memoryview`` over the
+    mapping (usable with ``np.frombuffer`` without copying) and names are
+    decoded only when read. The loaded table cannot grow: append raises
+    TypeError. On big-endian hosts the salary and offset columns are read
+    into byteswapped copies instead of being mapped.
+    
+    Parameters
+    ----------
+    path : str
+        A file written by save_table.
+    writable : bool
+        Write salary changes through to the file. By default changes stay
+        private to this process (copy-on-write).
+    
+    Returns
+    -------
+    EmployeeTable
+        A table backed by the mapped file.
+    
+    Raises
+    ------
+    ValueError
+        If the file is not an employee store, or writable is requested
+        on a big-endian host, where the columns are copies.
+    """
+    swap = sys.byteorder != "little"
+    if swap and writable:
+        raise ValueError("Writable employee stores require a little-endian host")
+    
+    with open(path, "r+b" if writable else "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _STORE_HEADER.size:
+            raise ValueError(f"'{path}' is not an employee store")
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_COPY
+        mapped = mmap.mmap(f.fileno(), 0, access=access)
+    
+    magic, count, blob_size = _STORE_HEADER.unpack_from(mapped)
+    salaries_at, offsets_at, flags_at, names_at = _store_offsets(count)
+    if magic != STORE_MAGIC or names_at + blob_size != size:
+        mapped.close()
+        raise ValueError(f"'{path}' is not an employee store")
+    
+    view = memoryview(mapped)
+    salaries = view[salaries_at:offsets_at].cast("d")
+    offsets = view[offsets_at:flags_at].cast("Q")
+    if swap:
+        # The file is little-endian; convert copies to native order
+        salaries, offsets = array("d", salaries.tobytes()), array("Q", offsets.tobytes())
+        salaries.byteswap()
+        offsets.byteswap()
+    
+    table = EmployeeTable.__new__(EmployeeTable)
+    table.salaries = salaries
+    table.names = _NameColumn(view[names_at:], offsets)
+    table._int_flags = view[flags_at:names_at]
+    table._listeners = []
+    table._listener_lock = nullcontext()
+    # Keep the mapping alive for as long as the table uses it
+    table._mmap = mapped
+    return table
+
+
+# Object counts benchmarked by default; 10**7 needs a few GB of memory
+EMP_BENCHMARK_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+EMP_BENCHMARK_METRICS = ("construct_ns", "inc_ns", "read_ns", "bytes_per_object")
+
+
+def _emp_variants() -> list:
+    """Return (name, class) for every emp implementation."""
+    return [
+        ("emp", emp),
+        ("emp_v2", emp_v2),
+        ("emp_v3", emp_v3),
+        ("emp_v4", emp_v4),
+        ("emp_v5", emp_v5),
+        ("emp_v6", emp_v6),
+        ("emp_v7", emp_v7),
+        ("emp_v8", emp_v8),
+        ("emp_v9", emp_v9),
+        ("emp_v10", emp_v10),
+    ]
+
+
+def _instance_size(obj) -> int:
+    """Return sys.getsizeof of an object plus its dict and dict values."""
+    size = sys.getsizeof(obj)
+    attrs = getattr(obj, "__dict__", None)
+    if attrs is not None:
+        size += sys.getsizeof(attrs)
+        # emp_v8 keeps its fields in a second dict
+        size += sum(sys.getsizeof(value) for value in attrs.values()
+                    if isinstance(value, dict))
+    return size
+
+
+def benchmark_emp_variants(sizes=EMP_BENCHMARK_SIZES, repeats: int = 5,
+                           memory: bool = True) -> list:
+    """
+    Measure the hot-path cost of every emp implementation.
+    
+    For each size, every implementation is timed constructing that many
+    objects, calling ``inc`` on each and reading ``s`` from each. Timings
+    are per object, median of `repeats` runs with the garbage collector
+    paused, and include the same loop overhead for every implementation.
+    Memory per object comes from a separate tracemalloc run, next to a
+    sys.getsizeof estimate of one instance.
+    
+    Parameters
+    ----------
+    sizes : iterable of int
+        Numbers of objects to benchmark.
+    repeats : int
+        Number of timed runs per measurement.
+    memory : bool
+        Also measure memory per object under tracemalloc.
+    
+    Returns
+    -------
+    list of dict
+        One row per implementation and size with 'construct_ns', 'inc_ns',
+        'read_ns', 'getsizeof_bytes' and 'bytes_per_object'.
+    """
+    import gc
+    import statistics
+    import time
+    import tracemalloc
+    
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    
+    rows = []
+    for size in sizes:
+        names = [f"Employee{i}" for i in range(size)]
+        salaries = [30000 + i % 90000 for i in range(size)]
+        for name, cls in _emp_variants():
+            construct, inc, read = [], [], []
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                for _ in range(repeats):
+                    start = time.perf_counter_ns()
+                    objs = [cls(n, s) for n, s in zip(names, salaries)]
+                    construct.append((time.perf_counter_ns() - start) / size)
+                    
+                    start = time.perf_counter_ns()
+                    for obj in objs:
+                        obj.inc(1)
+                    inc.append((time.perf_counter_ns() - start) / size)
+                    
+                    start = time.perf_counter_ns()
+                    for obj in objs:
+                        obj.s
+                    read.append((time.perf_counter_ns() - start) / size)
+                    del objs
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            
+            row = {
+                "implementation": name,
+                "size": size,
+                "construct_ns": statistics.median(construct),
+                "inc_ns": statistics.median(inc),
+                "read_ns": statistics.median(read),
+                "getsizeof_bytes": _instance_size(cls(names[0], salaries[0])),
+            }
+            if memory:
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    objs = [cls(n, s) for n, s in zip(names, salaries)]
+                    # Leave out the list holding the objects
+                    traced = tracemalloc.get_traced_memory()[0] - sys.getsizeof(objs)
+                    row["bytes_per_object"] = traced / size
+                    del objs
+                finally:
+                    tracemalloc.stop()
+            rows.append(row)
+    return rows
+
+
+def rank_emp_benchmarks(rows: list, size: int = None) -> dict:
+    """
+    Rank the implementations on each metric, cheapest first.
+    
+    Parameters
+    ----------
+    rows : list of dict
+        Rows from benchmark_emp_variants.
+    size : int, optional
+        The object count to rank at. Defaults to the largest measured.
+    
+    Returns
+    -------
+    dict
+        Maps each metric in EMP_BENCHMARK_METRICS that was measured to a
+        list of (implementation, value, times_slower_than_best) tuples.
+    """
+    if size is None:
+        size = max(row["size"] for row in rows)
+    rows = [row for row in rows if row["size"] == size]
+    
+    ranking = {}
+    for metric in EMP_BENCHMARK_METRICS:
+        measured = sorted((row for row in rows if metric in row), key=lambda row: row[metric])
+        if not measured:
+            continue
+        best = measured[0][metric]
+        ranking[metric] = [(row["implementation"], row[metric],
+                            row[metric] / best if best > 0 else 1.0)
+                           for row in measured]
+    return ranking
+
+
 # Comprehensive Testing
 def run_comparison_tests():
     """Run comprehensive tests for all implementations."""
@@ -373,6 +1672,400 @@ def compare_output():
         print(f"{impl_name:20} : Final Salary = {actual:10.2f} | {status}")
 
 
+def compare_table_memory():
+    """Compare EmployeeTable with emp objects for output and memory."""
+    import tracemalloc
+    
+    print("\n" + "="*80)
+    print("Columnar EmployeeTable - Output and Memory")
+    print("="*80)
+    
+    size = 100000
+    rows = [(f"Employee{i}", 40000 + i % 5000) for i in range(size)]
+    
+    tracemalloc.start()
+    employees = [emp(n, s) for n, s in rows]
+    emp_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    table = EmployeeTable(rows)
+    table_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    for employee, row in zip(employees, table):
+        employee.inc(7)
+        row.inc(7)
+    
+    match = all(employee.n == row.n and employee.s == row.s
+                for employee, row in zip(employees, table))
+    status = "✓ MATCH" if match else "✗ MISMATCH"
+    print(f"{status} | {size:,} employees after inc(7)")
+    print(f"emp objects    : {emp_bytes:>12,} bytes")
+    print(f"EmployeeTable  : {table_bytes:>12,} bytes ({emp_bytes / table_bytes:.1f}x smaller)")
+
+
+def compare_bulk_increase():
+    """Check bulk raises against per-object emp.inc calls."""
+    import random
+    import time
+    
+    print("\n" + "="*80)
+    print("Bulk Salary Increase - apply_increase vs emp.inc")
+    print("="*80)
+    
+    rng = random.Random(0)
+    size = 200000
+    rows = [(f"Employee{i}", rng.choice([rng.randrange(30000, 90000), rng.uniform(30000, 90000)]))
+            for i in range(size)]
+    per_row = [rng.choice([2, 3.5, 5, 10]) for _ in range(size)]
+    department = [i % 3 == 0 for i in range(size)]
+    raises = [(5, None), (per_row, None), (12.5, department)]
+    
+    employees = [emp(n, s) for n, s in rows]
+    start = time.perf_counter()
+    for pct, mask in raises:
+        for i, employee in enumerate(employees):
+            if mask is None or mask[i]:
+                employee.inc(pct if isinstance(pct, (int, float)) else pct[i])
+    loop_time = time.perf_counter() - start
+    
+    table = EmployeeTable(rows)
+    start = time.perf_counter()
+    apply_increases(table, raises)
+    bulk_time = time.perf_counter() - start
+    
+    match = all(employee.s == table.salary(i) for i, employee in enumerate(employees))
+    status = "✓ MATCH" if match else "✗ MISMATCH"
+    print(f"{status} | {size:,} employees, {len(raises)} compounded raises")
+    print(f"emp.inc loop    : {loop_time:.4f}s")
+    print(f"apply_increases : {bulk_time:.4f}s")
+
+
+def compare_report_output():
+    """Check buffered reports against emp.pr output and time both."""
+    import contextlib
+    import tempfile
+    import time
+    
+    print("\n" + "="*80)
+    print("Buffered Report Writer - write_report vs emp.pr")
+    print("="*80)
+    
+    size = 200000
+    employees = [emp(f"Employee{i}", 40000 + i % 5000) for i in range(size)]
+    for employee in employees[::2]:
+        employee.inc(7)
+    table = EmployeeTable.from_emps(employees)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Line-buffered files behave like stdout attached to a terminal
+        def timed(path, run):
+            with open(path, "w", buffering=1, encoding="utf-8") as f:
+                start = time.perf_counter()
+                run(f)
+                elapsed = time.perf_counter() - start
+            with open(path, encoding="utf-8") as f:
+                return f.read(), elapsed
+        
+        def print_all(f):
+            with contextlib.redirect_stdout(f):
+                for employee in employees:
+                    employee.pr()
+        
+        expected, print_time = timed(os.path.join(tmp, "pr.txt"), print_all)
+        print(f"{'emp.pr':28} : {print_time:.4f}s")
+        
+        for label, source in (("emp objects", employees), ("EmployeeTable", table)):
+            result, report_time = timed(os.path.join(tmp, "report.txt"),
+                                        lambda f: write_report(source, f))
+            status = "✓ IDENTICAL" if result == expected else "✗ DIFFERENT"
+            print(f"{'write_report(' + label + ')':28} : {report_time:.4f}s | {status}")
+    
+    for fmt in ("csv", "jsonl"):
+        result = io.StringIO()
+        rows = write_report(employees, result, fmt)
+        print(f"✓ {fmt:5} | {rows:,} rows, {len(result.getvalue()):,} characters")
+
+
+def compare_store_reload():
+    """Compare reloading a saved table with rebuilding emp objects from CSV."""
+    import tempfile
+    import time
+    
+    print("\n" + "="*80)
+    print("Persistent Employee Store - load_table vs CSV rebuild")
+    print("="*80)
+    
+    size = 500000
+    table = EmployeeTable((f"Employee{i}", 40000 + i % 5000) for i in range(size))
+    apply_increase(table, 3, mask=[i % 2 == 0 for i in range(size)])
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "employees.csv")
+        store_path = os.path.join(tmp, "employees.bin")
+        write_report(table, csv_path, "csv")
+        save_table(table, store_path)
+        
+        start = time.perf_counter()
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))[1:]
+            rebuilt = [emp(n, float(s)) for n, s in rows]
+        csv_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        loaded = load_table(store_path)
+        load_time = time.perf_counter() - start
+        
+        match = (len(loaded) == len(table)
+                 and list(loaded.names) == table.names
+                 and all(loaded.salary(i) == table.salary(i) for i in range(size)))
+        status = "✓ MATCH" if match else "✗ MISMATCH"
+        print(f"{status} | {size:,} employees | {os.path.getsize(store_path):,} bytes on disk")
+        print(f"CSV rebuild of emp objects : {csv_time:.4f}s ({len(rebuilt):,} rows)")
+        print(f"load_table (mmap)          : {load_time:.6f}s")
+        
+        # A mapped table has fixed columns, so growing it must fail cleanly
+        try:
+            loaded.append("New hire", 50000)
+            print("✗ MISMATCH | append on a loaded table was accepted")
+        except TypeError:
+            print(f"✓ MATCH | append on a loaded table raises TypeError ({len(loaded):,} rows)")
+        
+        # Release the exported views before the mapping can be closed
+        del loaded
+
+
+def compare_index_lookups():
+    """Check EmployeeIndex queries against list scans after raises."""
+    import random
+    import time
+    
+    print("\n" + "="*80)
+    print("Employee Index - lookups after inc() and bulk raises")
+    print("="*80)
+    
+    rng = random.Random(1)
+    size = 100000
+    table = EmployeeTable((f"Employee{i % 50000}", rng.randrange(30000, 120000))
+                          for i in range(size))
+    index = EmployeeIndex(table)
+    
+    # Single raises, a departmental bulk raise and new hires
+    for i in rng.sample(range(size), 500):
+        table[i].inc(rng.choice([3, 5, 8]))
+    apply_increase(table, 4, mask=[i % 7 == 0 for i in range(size)])
+    for i in range(100):
+        table.append(f"NewHire{i}", rng.randrange(30000, 200000))
+    
+    def scan_range(low, high):
+        return sorted((table.salaries[i], i) for i in range(len(table))
+                      if low <= table.salaries[i] <= high)
+    
+    checks = []
+    start = time.perf_counter()
+    found = index.find("Employee123")
+    in_range = index.salary_range(60000, 61000)
+    top = index.top_k(10)
+    index_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    checks.append([row._index for row in found]
+                  == [i for i, n in enumerate(table.names) if n == "Employee123"])
+    checks.append([row._index for row in in_range] == [i for _, i in scan_range(60000, 61000)])
+    checks.append([row._index for row in top]
+                  == [i for _, i in sorted(zip(table.salaries, range(len(table))))[-10:][::-1]])
+    scan_time = time.perf_counter() - start
+    
+    status = "✓ MATCH" if all(checks) else "✗ MISMATCH"
+    print(f"{status} | find / salary_range / top_k over {len(table):,} employees")
+    print(f"EmployeeIndex : {index_time:.6f}s")
+    print(f"List scans    : {scan_time:.6f}s")
+
+
+def compare_concurrent_raises():
+    """Stress ConcurrentEmployeeTable from many threads and count lost updates."""
+    import random
+    import time
+    
+    print("\n" + "="*80)
+    print("Concurrent Raises - striped locks vs unguarded emp")
+    print("="*80)
+    
+    size = 4096
+    start_salaries = [1000 + i for i in range(size)]
+    # A 100% raise doubles a salary exactly, so the final value shows how
+    # many raises landed no matter which thread applied them first
+    
+    class Unguarded:
+        """The ConcurrentEmployeeTable calls, forwarded straight to emp."""
+        
+        def __init__(self, emps):
+            self.emps = emps
+        
+        def salary(self, i):
+            return self.emps[i].s
+        
+        def inc(self, i, p):
+            self.emps[i].inc(p)
+        
+        def apply_raises(self, raises):
+            for i, p in raises:
+                self.emps[i].inc(p)
+    
+    def worker(target, rows, batched):
+        if batched:
+            for k in range(0, len(rows), 32):
+                target.apply_raises((i, 100) for i in rows[k:k + 32])
+        else:
+            for i in rows:
+                target.inc(i, 100)
+    
+    def stress(target, table, thread_count):
+        orders = []
+        for t in range(thread_count):
+            rows = list(range(size))
+            random.Random(t).shuffle(rows)
+            orders.append(rows)
+        threads = [threading.Thread(target=worker, args=(target, rows, t % 2 == 1))
+                   for t, rows in enumerate(orders)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        lost = sum(table.salary(i) != s * 2 ** thread_count
+                   for i, s in enumerate(start_salaries))
+        return elapsed, lost
+    
+    # A short switch interval makes thread interleaving far more likely
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread_count in [1, 2, 4, 8]:
+            table = EmployeeTable((f"Employee{i}", s) for i, s in enumerate(start_salaries))
+            concurrent = ConcurrentEmployeeTable(table)
+            # The index must follow every raise, from whichever thread
+            index = EmployeeIndex(table)
+            elapsed, lost = stress(concurrent, table, thread_count)
+            index_ok = index._by_salary == sorted(zip(table.salaries, range(size)))
+            status = "✓ MATCH" if lost == 0 and index_ok else "✗ MISMATCH"
+            rate = size * thread_count / elapsed
+            print(f"{status} | Threads: {thread_count} | {rate:12,.0f} raises/s | "
+                  f"Lost updates: {lost} | Index: {'✓' if index_ok else '✗'}")
+        
+        # Same load on plain emp objects, whose inc has no locking
+        emps = [emp(f"Employee{i}", s) for i, s in enumerate(start_salaries)]
+        unguarded = Unguarded(emps)
+        elapsed, lost = stress(unguarded, unguarded, 8)
+        print(f"Unguarded | Threads: 8 | {size * 8 / elapsed:12,.0f} raises/s | "
+              f"Lost updates: {lost}")
+    finally:
+        sys.setswitchinterval(old_interval)
+
+
+def compare_async_pipeline():
+    """Check the async pipeline against a synchronous build and report."""
+    import random
+    import tempfile
+    import time
+    
+    print("\n" + "="*80)
+    print("Async Pipeline - concurrent sources, raises and backpressure")
+    print("="*80)
+    
+    rng = random.Random(5)
+    groups = [[(f"Team{t}Employee{i}", rng.randrange(30000, 120000)) for i in range(300)]
+              for t in range(4)]
+    raises = [(10, None), (5, lambda n, s: s > 90000)]
+    
+    # Synchronous reference: one source after another, then emp.inc
+    expected = []
+    for n, s in (record for group in groups for record in group):
+        employee = emp(n, s)
+        employee.inc(10)
+        if employee.s > 90000:
+            employee.inc(5)
+        expected.append(f"emp: {employee.n} salary: {employee.s}\n")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # One of the four groups arrives as a JSON Lines file
+        file_path = os.path.join(tmp, "team3.jsonl")
+        write_report([emp(n, s) for n, s in groups[3]], file_path, "jsonl")
+        
+        for delay in [0.0, 0.001]:
+            sources = [FakeEmployeeSource(group, delay) for group in groups[:3]]
+            out = io.StringIO()
+            start = time.perf_counter()
+            asyncio.run(run_employee_pipeline(sources + [file_path], raises, out,
+                                              batch_size=64))
+            elapsed = time.perf_counter() - start
+            match = sorted(out.getvalue().splitlines(keepends=True)) == sorted(expected)
+            status = "✓ MATCH" if match else "✗ MISMATCH"
+            print(f"{status} | Delay per record: {delay:.3f}s | "
+                  f"{sum(map(len, groups)):,} employees | Time: {elapsed:.4f}s")
+    
+    class SlowStream(io.StringIO):
+        """A report target that takes a while to accept each write."""
+        
+        def __init__(self, sources):
+            super().__init__()
+            self.sources = sources
+            self.max_in_flight = 0
+        
+        def write(self, data):
+            time.sleep(0.002)
+            written = self.getvalue().count("\n") + data.count("\n")
+            produced = sum(source.produced for source in self.sources)
+            self.max_in_flight = max(self.max_in_flight, produced - written)
+            return super().write(data)
+    
+    sources = [FakeEmployeeSource((f"Employee{i}", 50000) for i in range(5000))
+               for _ in range(2)]
+    slow = SlowStream(sources)
+    queue_size, batch_size = 4, 32
+    # Without keeping the table, nothing else grows with the input
+    kept = asyncio.run(run_employee_pipeline(sources, target=slow, queue_size=queue_size,
+                                             batch_size=batch_size, keep_table=False))
+    # Both queues full, plus one batch held by each stage and each source
+    bound = (2 * queue_size + len(sources) + 3) * batch_size
+    complete = kept is None and slow.getvalue().count("\n") == 10000
+    status = "✓ MATCH" if slow.max_in_flight <= bound and complete else "✗ MISMATCH"
+    print(f"{status} | Slow target: at most {slow.max_in_flight} of 10,000 records "
+          f"in flight (bound {bound})")
+
+
+def compare_emp_variants(sizes=(10**3, 10**4, 10**5)):
+    """Benchmark the emp implementations and print a ranked report."""
+    print("\n" + "="*80)
+    print("Employee Variants - construction, inc(), attribute read and memory")
+    print("="*80)
+    
+    rows = benchmark_emp_variants(sizes, repeats=3)
+    labels = {
+        "construct_ns": ("Construction", "ns/object"),
+        "inc_ns": ("inc()", "ns/call"),
+        "read_ns": ("Read .s", "ns/read"),
+        "bytes_per_object": ("Memory (tracemalloc)", "bytes/object"),
+    }
+    
+    print(f"\n{'Implementation':16} {'Size':>10} {'Construct':>10} {'inc()':>8} "
+          f"{'Read':>8} {'getsizeof':>10} {'Traced':>8}")
+    print("-" * 80)
+    for row in rows:
+        print(f"{row['implementation']:16} {row['size']:>10,} {row['construct_ns']:>10.1f} "
+              f"{row['inc_ns']:>8.1f} {row['read_ns']:>8.1f} "
+              f"{row['getsizeof_bytes']:>10} {row.get('bytes_per_object', 0):>8.1f}")
+    
+    ranking = rank_emp_benchmarks(rows)
+    for metric, ranked in ranking.items():
+        title, unit = labels[metric]
+        print(f"\n{title} at {max(sizes):,} objects ({unit}):")
+        for rank, (name, value, slower) in enumerate(ranked, 1):
+            print(f"  {rank:2}. {name:10} {value:10.1f}  ({slower:.2f}x)")
+
+
 if __name__ == "__main__":
     # Run comparison tests
     run_comparison_tests()
@@ -381,4 +2074,28 @@ if __name__ == "__main__":
     demonstrate_different_scenarios()
     
     # Compare outputs
-    compare_output()
\ No newline at end of file
+    compare_output()
+    
+    # Compare columnar table with emp objects
+    compare_table_memory()
+    
+    # Compare bulk raises with per-object increments
+    compare_bulk_increase()
+    
+    # Compare buffered reports with emp.pr
+    compare_report_output()
+    
+    # Compare persistent store reload with CSV rebuild
+    compare_store_reload()
+    
+    # Compare indexed lookups with list scans
+    compare_index_lookups()
+    
+    # Stress striped-lock raises across thread counts
+    compare_concurrent_raises()
+    
+    # Check the async ingestion and reporting pipeline
+    compare_async_pipeline()
+    
+    # Rank the emp implementations by hot-path cost and memory
+    compare_emp_variants()
\ No newline at end of file